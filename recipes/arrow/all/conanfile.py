@@ -36,6 +36,7 @@ class ArrowConan(ConanFile):
         "with_grpc": ["auto", True, False],
         "with_hiveserver2": [True, False],
         "with_jemalloc": ["auto", True, False],
+        "with_mimalloc": [True, False],
         "with_json": [True, False],
         "with_llvm": ["auto", True, False],
         "with_openssl": ["auto", True, False],
@@ -50,6 +51,8 @@ class ArrowConan(ConanFile):
         "with_snappy": [True, False],
         "with_zlib": [True, False],
         "with_zstd": [True, False],
+        "simd_level": [None, "none", "sse4_2", "avx2", "avx512", "neon"],
+        "runtime_simd_level": [None, "sse4_2", "avx2", "avx512", "max"],
     }
     default_options = {
         "shared": False,
@@ -73,6 +76,7 @@ class ArrowConan(ConanFile):
         "with_flight_rpc": False,
         "with_gflags": "auto",
         "with_jemalloc": "auto",
+        "with_mimalloc": False,
         "with_glog": "auto",
         "with_grpc": "auto",
         "with_hiveserver2": False,
@@ -88,10 +92,14 @@ class ArrowConan(ConanFile):
         "with_snappy": False,
         "with_zlib": False,
         "with_zstd": False,
+        "simd_level": None,
+        "runtime_simd_level": None,
     }
 
     _cmake = None
 
+    _x86_simd_levels = ["sse4_2", "avx2", "avx512"]
+
     @property
     def _source_subfolder(self):
         return "source_subfolder"
@@ -124,6 +132,22 @@ class ArrowConan(ConanFile):
             raise ConanInvalidConfiguration("with_openssl options is required (or choose auto)")
         if self.options.with_llvm == False and self._with_llvm(True):
             raise ConanInvalidConfiguration("with_openssl options is required (or choose auto)")
+        self._validate_simd_levels()
+
+    def _validate_simd_levels(self):
+        simd_level = str(self.options.simd_level)
+        runtime_simd_level = str(self.options.runtime_simd_level)
+        is_x86 = self.settings.arch in ["x86", "x86_64"]
+        if simd_level in self._x86_simd_levels and not is_x86:
+            raise ConanInvalidConfiguration("simd_level={} requires an x86 architecture".format(simd_level))
+        if simd_level == "neon" and not str(self.settings.arch).startswith("armv8"):
+            raise ConanInvalidConfiguration("simd_level=neon requires an armv8 architecture")
+        if runtime_simd_level != "None":
+            if not is_x86:
+                raise ConanInvalidConfiguration("runtime_simd_level is only supported on x86 architectures")
+            if simd_level in self._x86_simd_levels and runtime_simd_level != "max" and \
+               self._x86_simd_levels.index(runtime_simd_level) < self._x86_simd_levels.index(simd_level):
+                raise ConanInvalidConfiguration("runtime_simd_level can't be lower than simd_level")
 
     def _compute(self, required=False):
         if required or self.options.compute == "auto":
@@ -278,6 +302,12 @@ class ArrowConan(ConanFile):
         self._cmake.definitions["ARROW_CSV"] = self.options.with_csv
         self._cmake.definitions["ARROW_CUDA"] = self.options.with_cuda
         self._cmake.definitions["ARROW_JEMALLOC"] = self._with_jemalloc()
+        # CCI has no mimalloc recipe (yet): arrow builds its vendored copy
+        self._cmake.definitions["ARROW_MIMALLOC"] = self.options.with_mimalloc
+        if self.options.simd_level != "None":
+            self._cmake.definitions["ARROW_SIMD_LEVEL"] = str(self.options.simd_level).upper()
+        if self.options.runtime_simd_level != "None":
+            self._cmake.definitions["ARROW_RUNTIME_SIMD_LEVEL"] = str(self.options.runtime_simd_level).upper()
         self._cmake.definitions["ARROW_JSON"] = self.options.with_json
 
         # self._cmake.definitions["ARROW_BOOST_VENDORED"] = False
@@ -378,41 +408,42 @@ class ArrowConan(ConanFile):
         self.info.options.with_glog = self._with_glog()
         self.info.options.with_grpc = self._with_grpc()
 
+    def _add_component(self, name, lib):
+        self.cpp_info.components[name].libs = [self._lib_name(lib)]
+        self.cpp_info.components[name].names["cmake_find_package"] = lib
+        self.cpp_info.components[name].names["cmake_find_package_multi"] = lib
+        self.cpp_info.components[name].names["pkg_config"] = lib
+        if name != "libarrow":
+            self.cpp_info.components[name].requires = ["libarrow"]
+
     def package_info(self):
         self.cpp_info.filenames["cmake_find_package"] = "Arrow"
         self.cpp_info.filenames["cmake_find_package_multi"] = "Arrow"
-        self.cpp_info.components["libarrow"].libs = [self._lib_name("arrow")]
-        self.cpp_info.components["libarrow"].names["cmake_find_package"] = "arrow"
-        self.cpp_info.components["libarrow"].names["cmake_find_package_multi"] = "arrow"
-        self.cpp_info.components["libarrow"].names["pkg_config"] = "arrow"
+        self._add_component("libarrow", "arrow")
         if not self.options.shared:
             self.cpp_info.components["libarrow"].defines = ["ARROW_STATIC"]
             if self.settings.os == "Linux":
                 self.cpp_info.components["libarrow"].system_libs = ["pthread"]
+            if self.options.with_mimalloc:
+                # the vendored mimalloc is merged into this library
+                self.cpp_info.components["libarrow"].libs.append("arrow_bundled_dependencies")
 
         if self.options.parquet:
-            self.cpp_info.components["libparquet"].libs = [self._lib_name("parquet")]
-            self.cpp_info.components["libparquet"].names["cmake_find_package"] = "parquet"
-            self.cpp_info.components["libparquet"].names["cmake_find_package_multi"] = "parquet"
-            self.cpp_info.components["libparquet"].names["pkg_config"] = "parquet"
-            self.cpp_info.components["libparquet"].requires = ["libarrow"]
+            self._add_component("libparquet", "parquet")
 
         if self.options.plasma:
-            self.cpp_info.components["libplasma"].libs = [self._lib_name("plasma")]
-            self.cpp_info.components["libplasma"].names["cmake_find_package"] = "plasma"
-            self.cpp_info.components["libplasma"].names["cmake_find_package_multi"] = "plasma"
-            self.cpp_info.components["libplasma"].names["pkg_config"] = "plasma"
-            self.cpp_info.components["libplasma"].requires = ["libarrow"]
+            self._add_component("libplasma", "plasma")
 
         if self.options.gandiva:
-            self.cpp_info.components["libgandiva"].libs = [self._lib_name("gandiva")]
-            self.cpp_info.components["libgandiva"].names["cmake_find_package"] = "gandiva"
-            self.cpp_info.components["libgandiva"].names["cmake_find_package_multi"] = "gandiva"
-            self.cpp_info.components["libgandiva"].names["pkg_config"] = "gandiva"
-            self.cpp_info.components["libgandiva"].requires = ["libarrow"]
+            self._add_component("libgandiva", "gandiva")
 
         if self.options.dataset_modules:
-            self.cpp_info.components["dataset"].libs = ["arrow_dataset"]
+            self._add_component("libarrow_dataset", "arrow_dataset")
+            if self.options.parquet:
+                self.cpp_info.components["libarrow_dataset"].requires.append("libparquet")
+
+        if self.options.with_flight_rpc:
+            self._add_component("libarrow_flight", "arrow_flight")
 
         if self.options.cli:
             binpath = os.path.join(self.package_folder, "bin")
@@ -420,36 +451,61 @@ class ArrowConan(ConanFile):
             self.env_info.PATH.append(binpath)
 
         if self._with_boost():
+            boost_required = False
             if self.options.gandiva:
                 # FIXME: only filesystem component is used
                 self.cpp_info.components["libgandiva"].requires.append("boost::boost")
+                boost_required = True
             if self.options.parquet and self.settings.compiler == "gcc" and self.settings.compiler.version < tools.Version("4.9"):
                 self.cpp_info.components["libparquet"].requires.append("boost::boost")
+                boost_required = True
+            if not boost_required:
+                self.cpp_info.components["libarrow"].requires.append("boost::boost")
         if self._with_openssl():
-            self.cpp_info.components["libarrow"].requires.append("openssl::openssl")
+            # encryption is implemented in parquet, flight uses openssl through grpc, S3 through libarrow
+            if self.options.encryption and self.options.parquet:
+                self.cpp_info.components["libparquet"].requires.append("openssl::openssl")
+            if self.options.with_flight_rpc:
+                self.cpp_info.components["libarrow_flight"].requires.append("openssl::openssl")
+            if self.options.with_s3 or not (self.options.encryption and self.options.parquet or self.options.with_flight_rpc):
+                self.cpp_info.components["libarrow"].requires.append("openssl::openssl")
         if self._with_gflags():
-            self.cpp_info.components["libarrow"].requires.append("gflags::gflags")
+            if self.options.plasma:
+                self.cpp_info.components["libplasma"].requires.append("gflags::gflags")
+            else:
+                self.cpp_info.components["libarrow"].requires.append("gflags::gflags")
         if self._with_glog():
             self.cpp_info.components["libarrow"].requires.append("glog::glog")
         if self._with_jemalloc():
             self.cpp_info.components["libarrow"].requires.append("jemalloc::jemalloc")
         if self._with_re2():
-            self.cpp_info.components["libgandiva"].requires.append("re2::re2")
+            if self.options.gandiva:
+                self.cpp_info.components["libgandiva"].requires.append("re2::re2")
+            else:
+                self.cpp_info.components["libarrow"].requires.append("re2::re2")
         if self._with_protobuf():
-            self.cpp_info.components["libarrow"].requires.append("protobuf::protobuf")
+            if self.options.gandiva:
+                self.cpp_info.components["libgandiva"].requires.append("protobuf::protobuf")
+            if self.options.with_flight_rpc:
+                self.cpp_info.components["libarrow_flight"].requires.append("protobuf::protobuf")
+            if self.options.with_orc or not (self.options.gandiva or self.options.with_flight_rpc):
+                self.cpp_info.components["libarrow"].requires.append("protobuf::protobuf")
+        if self._with_grpc():
+            self.cpp_info.components["libarrow_flight"].requires.append("grpc::grpc")
         if self._with_utf8proc():
-            self.cpp_info.components["libarrow"].requires.append("uff8proc::uff8proc")
+            self.cpp_info.components["libarrow"].requires.append("utf8proc::utf8proc")
         if self._with_llvm():
-            self.cpp_info.components["libarrow"].requires.append("llvm::llvm")
+            self.cpp_info.components["libgandiva"].requires.append("llvm::llvm")
         if self._with_thrift():
-            self.cpp_info.components["libarrow"].requires.append("thrift::thrift")
+            if self.options.parquet:
+                self.cpp_info.components["libparquet"].requires.append("thrift::thrift")
+            if self.options.with_hiveserver2:
+                self.cpp_info.components["libarrow"].requires.append("thrift::thrift")
 
         if self.options.with_backtrace:
             self.cpp_info.components["libarrow"].requires.append("backtrace::backtrace")
         if self.options.with_cuda:
             self.cpp_info.components["libarrow"].requires.append("cuda::cuda")
-        if self.options.with_flight_rpc:
-            self.cpp_info.components["libarrow"].requires.append("flight::flight")
         if self.options.with_hiveserver2:
             self.cpp_info.components["libarrow"].requires.append("hiveserver2::hiveserver2")
         if self.options.with_json:
@@ -461,7 +517,7 @@ class ArrowConan(ConanFile):
         if self.options.with_brotli:
             self.cpp_info.components["libarrow"].requires.append("brotli::brotli")
         if self.options.with_bz2:
-            self.cpp_info.components["libarrow"].requires.append("bz2::bz2")
+            self.cpp_info.components["libarrow"].requires.append("bzip2::bzip2")
         if self.options.with_lz4:
             self.cpp_info.components["libarrow"].requires.append("lz4::lz4")
         if self.options.with_snappy:
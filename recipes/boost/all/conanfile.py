@@ -4,7 +4,9 @@ from conans.tools import Version, cppstd_flag
 from conans.errors import ConanException
 
 from conans.errors import ConanInvalidConfiguration
+import json
 import os
+import re
 import sys
 import shlex
 import shutil
@@ -23,6 +25,32 @@ lib_list = ['math', 'wave', 'container', 'contract', 'exception', 'graph', 'iost
             'atomic', 'filesystem', 'system', 'graph_parallel', 'python',
             'stacktrace', 'test', 'type_erasure']
 
+# Inter-library link dependencies of the compiled libraries, by FindBoost.cmake component name
+# see _Boost_COMPONENT_DEPENDENCIES in https://github.com/Kitware/CMake/blob/master/Modules/FindBoost.cmake
+
+lib_dependencies = {
+    'chrono': ['system'],
+    'contract': ['thread', 'chrono', 'date_time', 'system'],
+    'coroutine': ['context', 'thread', 'system'],
+    'fiber': ['context', 'filesystem'],
+    'fiber_numa': ['fiber'],
+    'filesystem': ['system'],
+    'graph': ['regex'],
+    'graph_parallel': ['mpi', 'serialization'],
+    'iostreams': ['regex'],
+    'locale': ['thread', 'chrono', 'date_time', 'system'],
+    'log': ['filesystem', 'thread', 'date_time', 'regex', 'chrono', 'atomic', 'system'],
+    'log_setup': ['log'],
+    'mpi': ['serialization'],
+    'mpi_python': ['python', 'mpi', 'serialization'],
+    'numpy': ['python'],
+    'thread': ['chrono', 'date_time', 'atomic', 'system'],
+    'timer': ['chrono', 'system'],
+    'type_erasure': ['thread', 'chrono', 'system'],
+    'wave': ['filesystem', 'serialization', 'thread', 'chrono', 'date_time', 'atomic', 'system'],
+    'wserialization': ['serialization'],
+}
+
 
 class BoostConan(ConanFile):
     name = "boost"
@@ -58,6 +86,10 @@ class BoostConan(ConanFile):
         "pch": [True, False],
         "extra_b2_flags": "ANY",  # custom b2 flags
         "i18n_backend": ["iconv", "icu", None],
+        "lto": [None, "full", "thin"],  # link time optimization of the compiled libraries
+        "visibility": ["global", "protected", "hidden"],
+        "optimization": [None, "off", "speed", "space"],  # None uses the default of the build_type
+        "inlining": [None, "off", "on", "full"],  # None uses the default of the build_type
     }
     options.update({"without_%s" % libname: [True, False] for libname in lib_list})
 
@@ -85,6 +117,10 @@ class BoostConan(ConanFile):
         'pch': True,
         'extra_b2_flags': 'None',
         "i18n_backend": 'iconv',
+        "lto": None,
+        "visibility": "hidden",
+        "optimization": None,
+        "inlining": None,
     }
 
     for libname in lib_list:
@@ -95,6 +131,8 @@ class BoostConan(ConanFile):
     no_copy_source = True
     exports_sources = ['patches/*']
 
+    _python_info_cache = None
+
     @property
     def _source_subfolder(self):
         return "source_subfolder"
@@ -141,6 +179,16 @@ class BoostConan(ConanFile):
                 if not self.options.get_safe('without_%s' % lib):
                     raise ConanInvalidConfiguration("Boost '%s' library requires multi threading" % lib)
 
+        if self.options.lto == "thin" and "clang" not in str(self.settings.compiler):
+            raise ConanInvalidConfiguration("Thin LTO is only supported by clang")
+        if self.options.lto and self.settings.compiler not in ("gcc", "clang", "apple-clang", "Visual Studio"):
+            raise ConanInvalidConfiguration("LTO is not supported by compiler %s" % self.settings.compiler)
+        if self.options.lto and "clang" in str(self.settings.compiler) and \
+           not self.options.shared and not self.options.header_only:
+            # clang has no fat LTO objects: static archives would only contain bitcode,
+            # that consumers not using LTO with the same clang version can't link
+            raise ConanInvalidConfiguration("LTO with clang is only supported for shared Boost libraries")
+
     def build_requirements(self):
         self.build_requires("b2/4.2.0")
 
@@ -196,38 +244,56 @@ class BoostConan(ConanFile):
         self.output.info(output)
         return output if output != "None" else None
 
+    @property
+    def _python_info(self):
+        """
+        obtain everything needed about the python installation, running the interpreter only once
+        :return: dict with the version, abiflags, get_python_inc() result, sysconfig paths
+                 and sysconfig/distutils variables of the python interpreter
+        """
+        if self._python_info_cache is None:
+            # https://docs.python.org/3/library/sysconfig.html
+            # https://docs.python.org/2.7/library/sysconfig.html
+            # distutils is queried as well, as sometimes sysconfig returns empty values
+            # every lookup is guarded on its own, so a single failing query only leaves that field empty
+            var_names = ["INCLUDEPY", "INCLUDEDIR", "LIBRARY", "LDLIBRARY", "LIBDIR", "LIBDEST",
+                         "MULTIARCH", "multiarchsubdir", "WITH_DYLD"]
+            helpers = ("def safe(f):\\n"
+                       " try:\\n"
+                       "  return f()\\n"
+                       " except Exception:\\n"
+                       "  return None\\n"
+                       "def has_module(name):\\n"
+                       " try:\\n"
+                       "  import importlib.util\\n"
+                       " except ImportError:\\n"
+                       "  import pkgutil\\n"
+                       "  return pkgutil.find_loader(name) is not None\\n"
+                       " return importlib.util.find_spec(name) is not None\\n")
+            output = self._run_python_script("from __future__ import print_function; "
+                                             "import json, sys, sysconfig; "
+                                             "exec('%s'); "
+                                             "du = safe(lambda: __import__('distutils.sysconfig', fromlist=['get_config_var']) "
+                                             "if has_module('distutils') else None); "
+                                             "names = %s; "
+                                             "print(json.dumps({"
+                                             "'version': '%%s.%%s' %% tuple(sys.version_info[:2]), "
+                                             "'abiflags': getattr(sys, 'abiflags', ''), "
+                                             "'inc': safe(lambda: du.get_python_inc()) if du else None, "
+                                             "'paths': dict((p, safe(lambda: sysconfig.get_path(p))) for p in ('include', 'platinclude')), "
+                                             "'sc_vars': dict((n, safe(lambda: sysconfig.get_config_var(n))) for n in names), "
+                                             "'du_vars': dict((n, safe(lambda: du.get_config_var(n))) for n in names) if du else {}"
+                                             "}))" % (helpers, repr(var_names)))
+            self._python_info_cache = json.loads(output) if output else {}
+        return self._python_info_cache
+
     def _get_python_path(self, name):
         """
         obtain path entry for the python installation
         :param name: name of the python config entry for path to be queried (such as "include", "platinclude", etc.)
         :return: path entry from the sysconfig
         """
-        # https://docs.python.org/3/library/sysconfig.html
-        # https://docs.python.org/2.7/library/sysconfig.html
-        return self._run_python_script("from __future__ import print_function; "
-                                       "import sysconfig; "
-                                       "print(sysconfig.get_path('%s'))" % name)
-
-    def _get_python_sc_var(self, name):
-        """
-        obtain value of python sysconfig variable
-        :param name: name of variable to be queried (such as LIBRARY or LDLIBRARY)
-        :return: value of python sysconfig variable
-        """
-        return self._run_python_script("from __future__ import print_function; "
-                                       "import sysconfig; "
-                                       "print(sysconfig.get_config_var('%s'))" % name)
-
-    def _get_python_du_var(self, name):
-        """
-        obtain value of python distutils sysconfig variable
-        (sometimes sysconfig returns empty values, while python.sysconfig provides correct values)
-        :param name: name of variable to be queried (such as LIBRARY or LDLIBRARY)
-        :return: value of python sysconfig variable
-        """
-        return self._run_python_script("from __future__ import print_function; "
-                                       "import distutils.sysconfig as du_sysconfig; "
-                                       "print(du_sysconfig.get_config_var('%s'))" % name)
+        return self._python_info.get("paths", {}).get(name)
 
     def _get_python_var(self, name):
         """
@@ -235,7 +301,7 @@ class BoostConan(ConanFile):
         :param name: name of variable to be queried (such as LIBRARY or LDLIBRARY)
         :return: value of python sysconfig variable
         """
-        return self._get_python_sc_var(name) or self._get_python_du_var(name)
+        return self._python_info.get("sc_vars", {}).get(name) or self._python_info.get("du_vars", {}).get(name)
 
     @property
     def _python_version(self):
@@ -243,9 +309,7 @@ class BoostConan(ConanFile):
         obtain version of python interpreter
         :return: python interpreter version, in format major.minor
         """
-        version = self._run_python_script("from __future__ import print_function; "
-                                          "import sys; "
-                                          "print('%s.%s' % (sys.version_info[0], sys.version_info[1]))")
+        version = self._python_info.get("version")
         if self.options.python_version and version != self.options.python_version:
             raise ConanInvalidConfiguration("detected python version %s doesn't match conan option %s" % (version,
                                                                                           self.options.python_version))
@@ -257,9 +321,7 @@ class BoostConan(ConanFile):
         obtain the result of the "sysconfig.get_python_inc()" call
         :return: result of the "sysconfig.get_python_inc()" execution
         """
-        return self._run_python_script("from __future__ import print_function; "
-                                       "import sysconfig; "
-                                       "print(sysconfig.get_python_inc())")
+        return self._python_info.get("inc")
 
     @property
     def _python_abiflags(self):
@@ -267,9 +329,7 @@ class BoostConan(ConanFile):
         obtain python ABI flags, see https://www.python.org/dev/peps/pep-3149/ for the details
         :return: the value of python ABI flags
         """
-        return self._run_python_script("from __future__ import print_function; "
-                                       "import sys; "
-                                       "print(getattr(sys, 'abiflags', ''))")
+        return self._python_info.get("abiflags", "")
 
     @property
     def _python_includes(self):
@@ -625,6 +685,24 @@ class BoostConan(ConanFile):
                           "define=BOOST_USE_SEGMENTED_STACKS=1",
                           "define=BOOST_USE_UCONTEXT=1"])
         flags.append("pch=on" if self.options.pch else "pch=off")
+        flags.append("visibility=%s" % self.options.visibility)
+        if self.options.optimization:
+            flags.append("optimization=%s" % self.options.optimization)
+        if self.options.inlining:
+            flags.append("inlining=%s" % self.options.inlining)
+        if self.options.lto:
+            if self._is_msvc:
+                cxx_flags.append("/GL")
+                flags.append("linkflags=/LTCG")
+                flags.append("archiveflags=/LTCG")
+            else:
+                lto_flag = "-flto=thin" if self.options.lto == "thin" else "-flto"
+                cxx_flags.append(lto_flag)
+                flags.append("linkflags=%s" % lto_flag)
+                if not self.options.shared:
+                    # Keep regular object code next to the LTO bytecode, so the archives
+                    # also link without LTO or with another gcc version
+                    cxx_flags.append("-ffat-lto-objects")
 
         if tools.is_apple_os(self.settings.os):
             if self.settings.get_safe("os.version"):
@@ -851,89 +929,120 @@ class BoostConan(ConanFile):
         layout = self.options.get_safe("layout")
         return layout == "versioned" or (layout == "b2-default" and os.name == 'nt')
 
+    @property
+    def _lib_prefix(self):
+        return "%s_" % self.options.namespace
+
+    def _lib_component_name(self, lib):
+        """
+        obtain the component name of a compiled library, as named by FindBoost.cmake
+        :param lib: library name as found in the package, e.g. libboost_filesystem-vc142-mt-x64-1_73
+        :return: component name (e.g. filesystem), or None, if this is not a boost library
+        """
+        name = os.path.splitext(lib)[0].split("-")[0]
+        if name.startswith("lib" + self._lib_prefix):
+            name = name[len("lib"):]
+        if not name.startswith(self._lib_prefix):
+            return None
+        name = name[len(self._lib_prefix):]
+        # boost_python37 and boost_numpy37 are named after the python version
+        return re.sub(r"^(python|numpy|mpi_python)\d*$", r"\1", name)
+
     def package_info(self):
         gen_libs = [] if self.options.header_only else tools.collect_libs(self)
 
+        headers = self.cpp_info.components["headers"]
         if self._is_versioned_layout:
             version_tokens = str(self.version).split(".")
             if len(version_tokens) >= 2:
                 major = version_tokens[0]
                 minor = version_tokens[1]
                 boost_version_tag = "boost-%s_%s" % (major, minor)
-                self.cpp_info.includedirs = [os.path.join(self.package_folder, "include", boost_version_tag)]
-
-        # List of lists, so if more than one matches the lib like serialization and wserialization
-        # both will be added to the list
-        ordered_libs = [[] for _ in range(len(lib_list))]
+                headers.includedirs = [os.path.join("include", boost_version_tag)]
 
-        # The order is important, reorder following the lib_list order
-        missing_order_info = []
+        components = {}
         for real_lib_name in gen_libs:
-            for pos, alib in enumerate(lib_list):
-                if os.path.splitext(real_lib_name)[0].split("-")[0].endswith(alib):
-                    ordered_libs[pos].append(real_lib_name)
-                    break
-            else:
-                # self.output.info("Missing in order: %s" % real_lib_name)
-                if "_exec_monitor" not in real_lib_name:  # https://github.com/bincrafters/community/issues/94
-                    missing_order_info.append(real_lib_name)  # Assume they do not depend on other
-
-        # Flat the list and append the missing order
-        self.cpp_info.libs = [item for sublist in ordered_libs
-                                      for item in sublist if sublist] + missing_order_info
-
-        if self.options.without_test:  # remove boost_unit_test_framework
-            self.cpp_info.libs = [lib for lib in self.cpp_info.libs if "unit_test" not in lib]
-
-        self.output.info("LIBRARIES: %s" % self.cpp_info.libs)
+            if "_exec_monitor" in real_lib_name:  # https://github.com/bincrafters/community/issues/94
+                continue
+            name = self._lib_component_name(real_lib_name)
+            if not name:
+                self.output.warn("Unknown library in package: %s" % real_lib_name)
+                continue
+            components[name] = real_lib_name
+
+        external_requires = {}
+        if self._zip_bzip2_requires_needed:
+            for option, dependency in (("zlib", "zlib"), ("bzip2", "bzip2"), ("lzma", "xz_utils"), ("zstd", "zstd")):
+                if getattr(self.options, option):
+                    external_requires["%s::%s" % (dependency, dependency)] = ["iostreams"]
+        if self.options.i18n_backend == "icu":
+            external_requires["icu::icu"] = ["locale", "regex"]
+
+        for name, real_lib_name in components.items():
+            component = self.cpp_info.components[name]
+            component.libs = [real_lib_name]
+            component.requires = ["headers"] + [dep for dep in lib_dependencies.get(name, []) if dep in components]
+            component.requires.extend(dep for dep, users in external_requires.items() if name in users)
+            if self.settings.os == "Linux" and name.startswith("stacktrace_"):
+                component.system_libs.append("dl")
+                if name == "stacktrace_backtrace":
+                    component.system_libs.append("backtrace")
+            elif self.settings.os == "Windows" and name.startswith("stacktrace_windbg"):
+                component.system_libs.extend(["ole32", "dbgeng"])
+        # Dependencies without a compiled library to attach to are made available through the headers
+        for dep, users in external_requires.items():
+            if not any(user in components for user in users):
+                headers.requires.append(dep)
+
+        self.output.info("LIBRARIES: %s" % sorted(components.values()))
         self.output.info("Package folder: %s" % self.package_folder)
 
         if not self.options.header_only and self.options.shared:
-            self.cpp_info.defines.append("BOOST_ALL_DYN_LINK")
+            headers.defines.append("BOOST_ALL_DYN_LINK")
 
         if self.options.system_no_deprecated:
-            self.cpp_info.defines.append("BOOST_SYSTEM_NO_DEPRECATED")
+            headers.defines.append("BOOST_SYSTEM_NO_DEPRECATED")
 
         if self.options.asio_no_deprecated:
-            self.cpp_info.defines.append("BOOST_ASIO_NO_DEPRECATED")
+            headers.defines.append("BOOST_ASIO_NO_DEPRECATED")
 
         if self.options.filesystem_no_deprecated:
-            self.cpp_info.defines.append("BOOST_FILESYSTEM_NO_DEPRECATED")
+            headers.defines.append("BOOST_FILESYSTEM_NO_DEPRECATED")
 
         if self.options.segmented_stacks:
-            self.cpp_info.defines.extend(["BOOST_USE_SEGMENTED_STACKS", "BOOST_USE_UCONTEXT"])
+            headers.defines.extend(["BOOST_USE_SEGMENTED_STACKS", "BOOST_USE_UCONTEXT"])
 
         if self.settings.os != "Android":
             if self._gnu_cxx11_abi:
-                self.cpp_info.defines.append("_GLIBCXX_USE_CXX11_ABI=%s" % self._gnu_cxx11_abi)
+                headers.defines.append("_GLIBCXX_USE_CXX11_ABI=%s" % self._gnu_cxx11_abi)
 
         if not self.options.header_only:
             if self.options.error_code_header_only:
-                self.cpp_info.defines.append("BOOST_ERROR_CODE_HEADER_ONLY")
+                headers.defines.append("BOOST_ERROR_CODE_HEADER_ONLY")
 
             if not self.options.without_python:
                 if not self.options.shared:
-                    self.cpp_info.defines.append("BOOST_PYTHON_STATIC_LIB")
+                    headers.defines.append("BOOST_PYTHON_STATIC_LIB")
 
             if self._is_msvc or self._is_clang_cl:
                 if not self.options.magic_autolink:
                     # DISABLES AUTO LINKING! NO SMART AND MAGIC DECISIONS THANKS!
-                    self.cpp_info.defines.append("BOOST_ALL_NO_LIB")
+                    headers.defines.append("BOOST_ALL_NO_LIB")
                     self.output.info("Disabled magic autolinking (smart and magic decisions)")
                 else:
                     if self.options.layout == "system":
-                        self.cpp_info.defines.append("BOOST_AUTO_LINK_SYSTEM")
+                        headers.defines.append("BOOST_AUTO_LINK_SYSTEM")
                     elif self.options.layout == "tagged":
-                        self.cpp_info.defines.append("BOOST_AUTO_LINK_TAGGED")
+                        headers.defines.append("BOOST_AUTO_LINK_TAGGED")
                     self.output.info("Enabled magic autolinking (smart and magic decisions)")
 
                 # https://github.com/conan-community/conan-boost/issues/127#issuecomment-404750974
-                self.cpp_info.system_libs.append("bcrypt")
+                headers.system_libs.append("bcrypt")
             elif self.settings.os == "Linux":
                 # https://github.com/conan-community/community/issues/135
-                self.cpp_info.system_libs.append("rt")
+                headers.system_libs.append("rt")
                 if self.options.multithreading:
-                    self.cpp_info.system_libs.append("pthread")
+                    headers.system_libs.append("pthread")
             elif self.settings.os == "Emscripten":
                 if self.options.multithreading:
                     arch = self.settings.get_safe('arch')
@@ -943,11 +1052,13 @@ class BoostConan(ConanFile):
                     # So instead we are using the raw compiler flags (that are being activated
                     # from the aformentioned flag)
                     if arch.startswith("x86") or arch.startswith("wasm"):
-                        self.cpp_info.cxxflags.append("-pthread")
-                        self.cpp_info.sharedlinkflags.extend(["-pthread","--shared-memory"])
-                        self.cpp_info.exelinkflags.extend(["-pthread","--shared-memory"])
+                        headers.cxxflags.append("-pthread")
+                        headers.sharedlinkflags.extend(["-pthread","--shared-memory"])
+                        headers.exelinkflags.extend(["-pthread","--shared-memory"])
+
+        for component in self.cpp_info.components.values():
+            component.bindirs.append("lib")
 
         self.env_info.BOOST_ROOT = self.package_folder
-        self.cpp_info.bindirs.append("lib")
         self.cpp_info.names["cmake_find_package"] = "Boost"
         self.cpp_info.names["cmake_find_package_multi"] = "Boost"
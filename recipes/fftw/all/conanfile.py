@@ -18,13 +18,23 @@ class FFTWConan(ConanFile):
                "precision": ["double", "single", "longdouble"],
                "openmp": [True, False],
                "threads": [True, False],
-               "combinedthreads": [True, False]}
+               "combinedthreads": [True, False],
+               "simd_sse": [True, False],
+               "simd_sse2": [True, False],
+               "simd_avx": [True, False],
+               "simd_avx2": [True, False],
+               "wisdom_tool": [True, False]}
     default_options = {"shared": False,
                        "fPIC": True,
                        "precision": "double",
                        "openmp": False,
                        "threads": False,
-                       "combinedthreads": False}
+                       "combinedthreads": False,
+                       "simd_sse": False,
+                       "simd_sse2": False,
+                       "simd_avx": False,
+                       "simd_avx2": False,
+                       "wisdom_tool": False}
 
     _cmake = None
 
@@ -39,6 +49,11 @@ class FFTWConan(ConanFile):
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        if self.settings.arch not in ["x86", "x86_64"]:
+            del self.options.simd_sse
+            del self.options.simd_sse2
+            del self.options.simd_avx
+            del self.options.simd_avx2
 
     def configure(self):
         if self.options.shared:
@@ -52,6 +67,12 @@ class FFTWConan(ConanFile):
                 raise ConanInvalidConfiguration("Shared fftw with openmp can't be built on Windows")
             if self.options.threads and not self.options.combinedthreads:
                 raise ConanInvalidConfiguration("Shared fftw with threads and not combinedthreads can't be built on Windows")
+        if self.options.get_safe("simd_sse") and self.options.precision != "single":
+            raise ConanInvalidConfiguration("simd_sse is only available with single precision")
+        if self.options.precision == "longdouble":
+            for simd in ["simd_sse2", "simd_avx", "simd_avx2"]:
+                if self.options.get_safe(simd):
+                    raise ConanInvalidConfiguration("{} is not available with longdouble precision".format(simd))
 
     def source(self):
         tools.get(**self.conan_data["sources"][self.version])
@@ -68,6 +89,11 @@ class FFTWConan(ConanFile):
         self._cmake.definitions["WITH_COMBINED_THREADS"] = self.options.get_safe("combinedthreads", False)
         self._cmake.definitions["ENABLE_FLOAT"] = self.options.precision == "single"
         self._cmake.definitions["ENABLE_LONG_DOUBLE"] = self.options.precision == "longdouble"
+        self._cmake.definitions["ENABLE_SSE"] = self.options.get_safe("simd_sse", False)
+        self._cmake.definitions["ENABLE_SSE2"] = self.options.get_safe("simd_sse2", False)
+        self._cmake.definitions["ENABLE_AVX"] = self.options.get_safe("simd_avx", False)
+        self._cmake.definitions["ENABLE_AVX2"] = self.options.get_safe("simd_avx2", False)
+        self._cmake.definitions["CONAN_FFTW_WISDOM_TOOL"] = self.options.wisdom_tool
         self._cmake.configure(build_folder=self._build_subfolder)
         return self._cmake
 
@@ -98,3 +124,7 @@ class FFTWConan(ConanFile):
             self.cpp_info.components["fftwlib"].system_libs.append("m")
             if self.options.threads:
                 self.cpp_info.components["fftwlib"].system_libs.append("pthread")
+        if self.options.wisdom_tool:
+            bin_path = os.path.join(self.package_folder, "bin")
+            self.output.info("Appending PATH environment variable: {}".format(bin_path))
+            self.env_info.PATH.append(bin_path)
@@ -11,7 +11,7 @@ class Hdf5Conan(ConanFile):
     topics = ("conan", "hdf5", "hdf", "data")
     homepage = "https://portal.hdfgroup.org/display/HDF5/HDF5"
     url = "https://github.com/conan-io/conan-center-index"
-    exports_sources = ["CMakeLists.txt", "patches/**"]
+    exports_sources = ["CMakeLists.txt", "patches/**", "plugins/**"]
     generators = "cmake"
     settings = "os", "arch", "compiler", "build_type"
     options = {
@@ -22,7 +22,10 @@ class Hdf5Conan(ConanFile):
         "threadsafe": [True, False],
         "with_zlib": [True, False],
         "szip_support": [None, "with_libaec", "with_szip"],
-        "szip_encoding": [True, False]
+        "szip_encoding": [True, False],
+        "with_blosc": [True, False],
+        "with_lz4": [True, False],
+        "with_zstd": [True, False]
     }
     default_options = {
         "shared": False,
@@ -32,7 +35,10 @@ class Hdf5Conan(ConanFile):
         "threadsafe": False,
         "with_zlib": True,
         "szip_support": None,
-        "szip_encoding": False
+        "szip_encoding": False,
+        "with_blosc": False,
+        "with_lz4": False,
+        "with_zstd": False
     }
 
     _cmake = None
@@ -61,6 +67,13 @@ class Hdf5Conan(ConanFile):
              self.options.szip_encoding and \
              not self.options["szip"].enable_encoding:
             raise ConanInvalidConfiguration("encoding must be enabled in szip dependency (szip:enable_encoding=True)")
+        if self._filter_plugins and not self.options.shared:
+            # Plugins are loaded at runtime and must share the library state of a shared hdf5
+            raise ConanInvalidConfiguration("with_blosc, with_lz4 and with_zstd filter plugins require hdf5:shared=True")
+
+    @property
+    def _filter_plugins(self):
+        return self.options.with_blosc or self.options.with_lz4 or self.options.with_zstd
 
     def requirements(self):
         if self.options.with_zlib:
@@ -69,6 +82,12 @@ class Hdf5Conan(ConanFile):
             self.requires("libaec/1.0.4")
         elif self.options.szip_support == "with_szip":
             self.requires("szip/2.1.1")
+        if self.options.with_blosc:
+            self.requires("c-blosc/1.20.0")
+        if self.options.with_lz4:
+            self.requires("lz4/1.9.2")
+        if self.options.with_zstd:
+            self.requires("zstd/1.4.5")
 
     def source(self):
         tools.get(**self.conan_data["sources"][self.version])
@@ -128,6 +147,9 @@ class Hdf5Conan(ConanFile):
         self._cmake.definitions["HDF5_BUILD_CPP_LIB"] = self.options.enable_cxx
         if tools.Version(self.version) >= "1.10.0":
             self._cmake.definitions["HDF5_BUILD_JAVA"] = False
+        self._cmake.definitions["CONAN_HDF5_BLOSC_PLUGIN"] = self.options.with_blosc
+        self._cmake.definitions["CONAN_HDF5_LZ4_PLUGIN"] = self.options.with_lz4
+        self._cmake.definitions["CONAN_HDF5_ZSTD_PLUGIN"] = self.options.with_zstd
         self._cmake.configure(build_folder=self._build_subfolder)
         return self._cmake
 
@@ -155,6 +177,10 @@ class Hdf5Conan(ConanFile):
             self.cpp_info.system_libs.extend(["dl", "m"])
             if self.options.get_safe("threadsafe"):
                 self.cpp_info.system_libs.append("pthread")
+        if self._filter_plugins:
+            plugin_path = os.path.join(self.package_folder, "lib", "plugin")
+            self.output.info("Setting HDF5_PLUGIN_PATH environment variable: {}".format(plugin_path))
+            self.env_info.HDF5_PLUGIN_PATH = plugin_path
 
     def _get_ordered_libs(self):
         libs = ["hdf5"]
@@ -0,0 +1,127 @@
+/*
+ * HDF5 filter plugin for Blosc, registered filter id 32001.
+ *
+ * cd_values layout, compatible with the reference implementation:
+ *   [0] filter revision, [1] blosc format version, [2] type size,
+ *   [3] uncompressed chunk size, [4] compression level, [5] shuffle,
+ *   [6] compressor code (BLOSC_BLOSCLZ, BLOSC_LZ4, ...).
+ * [0] to [3] are filled in by set_local, [4] to [6] are optional.
+ */
+#include <hdf5.h>
+#include <H5PLextern.h>
+
+#include <blosc.h>
+
+#define H5Z_FILTER_BLOSC 32001
+#define H5Z_BLOSC_FILTER_REVISION 2
+#define H5Z_BLOSC_MAX_CD_VALUES 7
+#define H5Z_BLOSC_DEFAULT_CLEVEL 5
+
+static herr_t H5Z_blosc_set_local(hid_t dcpl, hid_t type, hid_t space)
+{
+    unsigned int flags;
+    size_t nelements = H5Z_BLOSC_MAX_CD_VALUES;
+    unsigned int values[H5Z_BLOSC_MAX_CD_VALUES] = {0};
+    hsize_t chunkdims[H5S_MAX_RANK];
+    size_t typesize, chunksize;
+    int ndims, i;
+    hid_t super_type;
+
+    (void)space;
+    if (H5Pget_filter_by_id2(dcpl, H5Z_FILTER_BLOSC, &flags, &nelements, values, 0, NULL, NULL) < 0)
+        return -1;
+    if (nelements < 4)
+        nelements = 4;
+
+    values[0] = H5Z_BLOSC_FILTER_REVISION;
+    values[1] = BLOSC_VERSION_FORMAT;
+
+    ndims = H5Pget_chunk(dcpl, H5S_MAX_RANK, chunkdims);
+    if (ndims < 0)
+        return -1;
+
+    typesize = H5Tget_size(type);
+    if (typesize == 0)
+        return -1;
+    chunksize = typesize;
+    for (i = 0; i < ndims; ++i)
+        chunksize *= (size_t)chunkdims[i];
+
+    /* Shuffle works on the element type of arrays */
+    if (H5Tget_class(type) == H5T_ARRAY) {
+        super_type = H5Tget_super(type);
+        typesize = H5Tget_size(super_type);
+        H5Tclose(super_type);
+    }
+    if (typesize > BLOSC_MAX_TYPESIZE)
+        typesize = 1;
+
+    values[2] = (unsigned int)typesize;
+    values[3] = (unsigned int)chunksize;
+
+    if (H5Pmodify_filter(dcpl, H5Z_FILTER_BLOSC, flags, nelements, values) < 0)
+        return -1;
+    return 1;
+}
+
+static size_t H5Z_filter_blosc(unsigned int flags, size_t cd_nelmts, const unsigned int cd_values[],
+                               size_t nbytes, size_t* buf_size, void** buf)
+{
+    void* out_buf = NULL;
+    size_t out_buf_size;
+    int status;
+
+    if (flags & H5Z_FLAG_REVERSE) {
+        size_t cbytes, blocksize;
+        blosc_cbuffer_sizes(*buf, &out_buf_size, &cbytes, &blocksize);
+        if (cbytes > nbytes)
+            return 0;
+        out_buf = H5allocate_memory(out_buf_size, 0);
+        if (out_buf == NULL)
+            return 0;
+        status = blosc_decompress_ctx(*buf, out_buf, out_buf_size, 1);
+    } else {
+        size_t const typesize = cd_nelmts > 2 ? cd_values[2] : 1;
+        int const clevel = cd_nelmts > 4 ? (int)cd_values[4] : H5Z_BLOSC_DEFAULT_CLEVEL;
+        int const doshuffle = cd_nelmts > 5 ? (int)cd_values[5] : BLOSC_SHUFFLE;
+        const char* compname = BLOSC_BLOSCLZ_COMPNAME;
+        if (cd_nelmts > 6 && blosc_compcode_to_compname((int)cd_values[6], &compname) < 0)
+            return 0;
+        out_buf_size = nbytes + BLOSC_MAX_OVERHEAD;
+        out_buf = H5allocate_memory(out_buf_size, 0);
+        if (out_buf == NULL)
+            return 0;
+        status = blosc_compress_ctx(clevel, doshuffle, typesize, nbytes, *buf, out_buf, out_buf_size,
+                                    compname, 0, 1);
+    }
+
+    if (status <= 0) {
+        H5free_memory(out_buf);
+        return 0;
+    }
+    H5free_memory(*buf);
+    *buf = out_buf;
+    *buf_size = out_buf_size;
+    return (size_t)status;
+}
+
+const H5Z_class2_t H5Z_BLOSC[1] = {{
+    H5Z_CLASS_T_VERS,
+    (H5Z_filter_t)H5Z_FILTER_BLOSC,
+    1, /* encoder present */
+    1, /* decoder present */
+    "blosc",
+    NULL, /* can_apply */
+    (H5Z_set_local_func_t)H5Z_blosc_set_local,
+    (H5Z_func_t)H5Z_filter_blosc,
+}};
+
+H5PL_type_t H5PLget_plugin_type(void)
+{
+    return H5PL_TYPE_FILTER;
+}
+
+const void* H5PLget_plugin_info(void)
+{
+    return H5Z_BLOSC;
+}
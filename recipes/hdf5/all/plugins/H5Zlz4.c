@@ -0,0 +1,171 @@
+/*
+ * HDF5 filter plugin for LZ4, registered filter id 32004.
+ *
+ * Chunk layout, compatible with the reference implementation:
+ *   original size (8 bytes, big endian), block size (4 bytes, big endian),
+ *   then for every block its compressed size (4 bytes, big endian) followed
+ *   by the data. A block whose compressed size equals its original size is
+ *   stored uncompressed. cd_values[0] is the optional block size in bytes.
+ */
+#include <string.h>
+
+#include <hdf5.h>
+#include <H5PLextern.h>
+
+#include <lz4.h>
+
+#define H5Z_FILTER_LZ4 32004
+#define H5Z_LZ4_DEFAULT_BLOCK_SIZE (1U << 30)
+#define H5Z_LZ4_HEADER_SIZE 12
+
+static void store_be32(unsigned char* dst, unsigned int value)
+{
+    dst[0] = (unsigned char)(value >> 24);
+    dst[1] = (unsigned char)(value >> 16);
+    dst[2] = (unsigned char)(value >> 8);
+    dst[3] = (unsigned char)value;
+}
+
+static unsigned int load_be32(const unsigned char* src)
+{
+    return ((unsigned int)src[0] << 24) | ((unsigned int)src[1] << 16) | ((unsigned int)src[2] << 8) | src[3];
+}
+
+static void store_be64(unsigned char* dst, unsigned long long value)
+{
+    store_be32(dst, (unsigned int)(value >> 32));
+    store_be32(dst + 4, (unsigned int)value);
+}
+
+static unsigned long long load_be64(const unsigned char* src)
+{
+    return ((unsigned long long)load_be32(src) << 32) | load_be32(src + 4);
+}
+
+static size_t H5Z_lz4_decompress(size_t nbytes, size_t* buf_size, void** buf)
+{
+    const unsigned char* src = (const unsigned char*)*buf;
+    const unsigned char* const src_end = src + nbytes;
+    unsigned long long orig_size;
+    size_t block_size, decompressed = 0;
+    unsigned char* out_buf;
+
+    if (nbytes < H5Z_LZ4_HEADER_SIZE)
+        return 0;
+    orig_size = load_be64(src);
+    block_size = load_be32(src + 8);
+    src += H5Z_LZ4_HEADER_SIZE;
+    if (block_size == 0 || block_size > orig_size)
+        block_size = (size_t)orig_size;
+
+    out_buf = (unsigned char*)H5allocate_memory((size_t)orig_size, 0);
+    if (out_buf == NULL)
+        return 0;
+
+    while (decompressed < orig_size) {
+        size_t compressed_block_size;
+        if (orig_size - decompressed < block_size)
+            block_size = (size_t)(orig_size - decompressed);
+        if (src_end - src < 4)
+            goto error;
+        compressed_block_size = load_be32(src);
+        src += 4;
+        if ((size_t)(src_end - src) < compressed_block_size)
+            goto error;
+        if (compressed_block_size == block_size) {
+            memcpy(out_buf + decompressed, src, block_size);
+        } else if (LZ4_decompress_safe((const char*)src, (char*)out_buf + decompressed,
+                                       (int)compressed_block_size, (int)block_size) != (int)block_size) {
+            goto error;
+        }
+        src += compressed_block_size;
+        decompressed += block_size;
+    }
+
+    H5free_memory(*buf);
+    *buf = out_buf;
+    *buf_size = (size_t)orig_size;
+    return (size_t)orig_size;
+
+error:
+    H5free_memory(out_buf);
+    return 0;
+}
+
+static size_t H5Z_lz4_compress(size_t cd_nelmts, const unsigned int cd_values[],
+                               size_t nbytes, size_t* buf_size, void** buf)
+{
+    const char* src = (const char*)*buf;
+    size_t block_size = (cd_nelmts > 0 && cd_values[0] > 0) ? cd_values[0] : H5Z_LZ4_DEFAULT_BLOCK_SIZE;
+    size_t n_blocks, out_buf_size, processed = 0;
+    unsigned char* out_buf;
+    unsigned char* dst;
+
+    if (block_size > nbytes)
+        block_size = nbytes;
+    if (block_size == 0 || block_size > (size_t)LZ4_MAX_INPUT_SIZE)
+        return 0;
+    n_blocks = (nbytes - 1) / block_size + 1;
+    out_buf_size = H5Z_LZ4_HEADER_SIZE + n_blocks * (4 + (size_t)LZ4_compressBound((int)block_size));
+
+    out_buf = (unsigned char*)H5allocate_memory(out_buf_size, 0);
+    if (out_buf == NULL)
+        return 0;
+    store_be64(out_buf, nbytes);
+    store_be32(out_buf + 8, (unsigned int)block_size);
+    dst = out_buf + H5Z_LZ4_HEADER_SIZE;
+
+    while (processed < nbytes) {
+        int compressed_block_size;
+        if (nbytes - processed < block_size)
+            block_size = nbytes - processed;
+        compressed_block_size = LZ4_compress_default(src + processed, (char*)dst + 4, (int)block_size,
+                                                     LZ4_compressBound((int)block_size));
+        if (compressed_block_size <= 0) {
+            H5free_memory(out_buf);
+            return 0;
+        }
+        if ((size_t)compressed_block_size >= block_size) {
+            /* Incompressible: store the block as is */
+            memcpy(dst + 4, src + processed, block_size);
+            compressed_block_size = (int)block_size;
+        }
+        store_be32(dst, (unsigned int)compressed_block_size);
+        dst += 4 + compressed_block_size;
+        processed += block_size;
+    }
+
+    H5free_memory(*buf);
+    *buf = out_buf;
+    *buf_size = out_buf_size;
+    return (size_t)(dst - out_buf);
+}
+
+static size_t H5Z_filter_lz4(unsigned int flags, size_t cd_nelmts, const unsigned int cd_values[],
+                             size_t nbytes, size_t* buf_size, void** buf)
+{
+    if (flags & H5Z_FLAG_REVERSE)
+        return H5Z_lz4_decompress(nbytes, buf_size, buf);
+    return H5Z_lz4_compress(cd_nelmts, cd_values, nbytes, buf_size, buf);
+}
+
+const H5Z_class2_t H5Z_LZ4[1] = {{
+    H5Z_CLASS_T_VERS,
+    (H5Z_filter_t)H5Z_FILTER_LZ4,
+    1, /* encoder present */
+    1, /* decoder present */
+    "lz4",
+    NULL, /* can_apply */
+    NULL, /* set_local */
+    (H5Z_func_t)H5Z_filter_lz4,
+}};
+
+H5PL_type_t H5PLget_plugin_type(void)
+{
+    return H5PL_TYPE_FILTER;
+}
+
+const void* H5PLget_plugin_info(void)
+{
+    return H5Z_LZ4;
+}
@@ -0,0 +1,69 @@
+/*
+ * HDF5 filter plugin for Zstandard, registered filter id 32015.
+ *
+ * The chunk is stored as a single zstd frame. cd_values[0] is the optional
+ * compression level.
+ */
+#include <hdf5.h>
+#include <H5PLextern.h>
+
+#include <zstd.h>
+
+#define H5Z_FILTER_ZSTD 32015
+#define H5Z_ZSTD_DEFAULT_LEVEL 3
+
+static size_t H5Z_filter_zstd(unsigned int flags, size_t cd_nelmts, const unsigned int cd_values[],
+                              size_t nbytes, size_t* buf_size, void** buf)
+{
+    void* out_buf = NULL;
+    size_t out_buf_size;
+    size_t ret;
+
+    if (flags & H5Z_FLAG_REVERSE) {
+        unsigned long long const content_size = ZSTD_getFrameContentSize(*buf, nbytes);
+        if (content_size == ZSTD_CONTENTSIZE_ERROR || content_size == ZSTD_CONTENTSIZE_UNKNOWN)
+            return 0;
+        out_buf_size = (size_t)content_size;
+        out_buf = H5allocate_memory(out_buf_size, 0);
+        if (out_buf == NULL)
+            return 0;
+        ret = ZSTD_decompress(out_buf, out_buf_size, *buf, nbytes);
+    } else {
+        int const level = cd_nelmts > 0 ? (int)cd_values[0] : H5Z_ZSTD_DEFAULT_LEVEL;
+        out_buf_size = ZSTD_compressBound(nbytes);
+        out_buf = H5allocate_memory(out_buf_size, 0);
+        if (out_buf == NULL)
+            return 0;
+        ret = ZSTD_compress(out_buf, out_buf_size, *buf, nbytes, level);
+    }
+
+    if (ZSTD_isError(ret)) {
+        H5free_memory(out_buf);
+        return 0;
+    }
+    H5free_memory(*buf);
+    *buf = out_buf;
+    *buf_size = out_buf_size;
+    return ret;
+}
+
+const H5Z_class2_t H5Z_ZSTD[1] = {{
+    H5Z_CLASS_T_VERS,
+    (H5Z_filter_t)H5Z_FILTER_ZSTD,
+    1, /* encoder present */
+    1, /* decoder present */
+    "zstd",
+    NULL, /* can_apply */
+    NULL, /* set_local */
+    (H5Z_func_t)H5Z_filter_zstd,
+}};
+
+H5PL_type_t H5PLget_plugin_type(void)
+{
+    return H5PL_TYPE_FILTER;
+}
+
+const void* H5PLget_plugin_info(void)
+{
+    return H5Z_ZSTD;
+}
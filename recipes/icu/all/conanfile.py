@@ -1,9 +1,11 @@
 import glob
+import hashlib
 import os
 import platform
 import shutil
 
 from conans import ConanFile, tools, AutoToolsBuildEnvironment
+from conans.errors import ConanInvalidConfiguration
 
 
 class ICUBase(ConanFile):
@@ -21,13 +23,15 @@ class ICUBase(ConanFile):
                "data_packaging": ["files", "archive", "library", "static"],
                "with_unit_tests": [True, False],
                "silent": [True, False],
-               "with_dyload": [True, False]}
+               "with_dyload": [True, False],
+               "data_filter": "ANY"}  # ICU data filter, either its JSON content or the absolute path to a filter file
     default_options = {"shared": False,
                        "fPIC": True,
                        "data_packaging": "archive",
                        "with_unit_tests": False,
                        "silent": True,
-                       "with_dyload": True}
+                       "with_dyload": True,
+                       "data_filter": None}
 
     _env_build = None
 
@@ -54,20 +58,58 @@ class ICUBase(ConanFile):
     def configure(self):
         if self.options.shared:
             del self.options.fPIC
+        if self.options.data_filter and not self._data_filter_is_content:
+            data_filter = str(self.options.data_filter)
+            if not os.path.isabs(data_filter) or not os.path.isfile(data_filter):
+                raise ConanInvalidConfiguration("icu:data_filter must be the JSON content of an ICU data filter "
+                                                "or the absolute path to an existing filter file, "
+                                                "got {}".format(data_filter))
 
     def package_id(self):
         del self.info.options.with_unit_tests  # ICU unit testing shouldn't affect the package's ID
         del self.info.options.silent  # Verbosity doesn't affect package's ID
+        if self.options.data_filter:
+            # The filter content, not its location, determines the data being packaged
+            self.info.options.data_filter = hashlib.sha256(self._data_filter.encode("utf-8")).hexdigest()
+
+    @property
+    def _cross_building(self):
+        return tools.cross_building(self.settings, skip_x64_x86=True)
 
     def build_requirements(self):
         if tools.os_info.is_windows and "CONAN_BASH_PATH" not in os.environ and \
                 tools.os_info.detect_windows_subsystem() != "msys2":
             self.build_requires("msys2/20200517")
+        if self._cross_building and hasattr(self, "settings_build"):
+            # native icupkg, genrb, pkgdata... of the same version, used through --with-cross-build
+            self.build_requires("icu/{}".format(self.version))
 
     def source(self):
         tools.get(**self.conan_data["sources"][self.version])
         os.rename("icu", self._source_subfolder)
 
+    @property
+    def _data_filter_is_content(self):
+        return str(self.options.data_filter).lstrip().startswith("{")
+
+    @property
+    def _data_filter(self):
+        if self._data_filter_is_content:
+            return str(self.options.data_filter)
+        return tools.load(str(self.options.data_filter))
+
+    def _prepare_data_sources(self):
+        # https://github.com/unicode-org/icu/blob/master/docs/userguide/icu_data/buildtool.md
+        # icu4c-*-src.tgz only ships the prebuilt .dat, which the build uses as is. Filters require
+        # the data sources of icu4c-*-data.zip in place of source/data.
+        tools.get(**self.conan_data["data"][self.version])
+        data_dir = os.path.join(self._source_subfolder, "source", "data")
+        tools.rmdir(data_dir)
+        shutil.move("data", data_dir)
+        filter_file = os.path.join(self.build_folder, "icu_data_filter.json")
+        tools.save(filter_file, self._data_filter)
+        return filter_file
+
     def build(self):
         for patch in self.conan_data.get("patches", {}).get(self.version, []):
             tools.patch(**patch)
@@ -83,10 +125,14 @@ class ICUBase(ConanFile):
         self._workaround_icu_20545()
 
         env_build = self._configure_autotools()
+        env_vars = dict(env_build.vars)
+        if self.options.data_filter:
+            filter_file = self._prepare_data_sources()
+            env_vars["ICU_DATA_FILTER_FILE"] = tools.unix_path(filter_file) if tools.os_info.is_windows else filter_file
         build_dir = os.path.join(self.build_folder, self._source_subfolder, "build")
         os.mkdir(build_dir)
         with tools.vcvars(self.settings) if self._is_msvc else tools.no_op():
-            with tools.environment_append(env_build.vars):
+            with tools.environment_append(env_vars):
                 with tools.chdir(build_dir):
                     # workaround for https://unicode-org.atlassian.net/browse/ICU-20531
                     os.makedirs(os.path.join("data", "out", "tmp"))
@@ -152,7 +198,11 @@ class ICUBase(ConanFile):
             args += ["--disable-dyload"]
 
         env_build = self._configure_autotools()
-        if tools.cross_building(self.settings, skip_x64_x86=True):
+        if self._cross_building:
+            if "icu" in self.deps_cpp_info.deps:
+                cross_build = self.deps_cpp_info["icu"].rootpath
+                cross_build = tools.unix_path(cross_build) if tools.os_info.is_windows else cross_build
+                args.append("--with-cross-build={}".format(cross_build))
             if env_build.build:
                 args.append("--build=%s" % env_build.build)
             if env_build.host:
@@ -195,10 +245,18 @@ class ICUBase(ConanFile):
         with tools.vcvars(self.settings) if self._is_msvc else tools.no_op():
             with tools.environment_append(env_build.vars):
                 with tools.chdir(build_dir):
-                    command = "make {silent} install".format(silent=self._silent)
+                    command = "make {silent} -j {cpu_count} install".format(silent=self._silent,
+                                                                            cpu_count=tools.cpu_count())
                     self.run(command, win_bash=tools.os_info.is_windows)
         self._install_name_tool()
 
+        # Layout expected by --with-cross-build when this package is the native ICU of a cross build:
+        # config/icucross.{mk,inc}, and every tool in bin (--sbindir points there) next to the libraries in lib.
+        # escapesrc is only used while building, so it isn't installed by make install.
+        self.copy("icucross.mk", src=os.path.join(build_dir, "config"), dst="config")
+        self.copy("icucross.inc", src=os.path.join(build_dir, "config"), dst="config")
+        self.copy("escapesrc*", src=os.path.join(build_dir, "bin"), dst="bin")
+
         for dll in glob.glob(os.path.join(self.package_folder, "lib", "*.dll")):
             shutil.move(dll, os.path.join(self.package_folder, "bin"))
 
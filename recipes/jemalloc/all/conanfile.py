@@ -27,6 +27,11 @@ class JemallocConan(ConanFile):
         "enable_debug_logging": [True, False],
         "enable_initial_exec_tls": [True, False],
         "enable_libdl": [True, False],
+        "enable_prof": [True, False],
+        "enable_stats": [True, False],
+        "lg_page": "ANY",
+        "lg_hugepage": "ANY",
+        "malloc_conf": "ANY",
     }
     default_options = {
         "shared": False,
@@ -41,6 +46,11 @@ class JemallocConan(ConanFile):
         "enable_debug_logging": False,
         "enable_initial_exec_tls": True,
         "enable_libdl": True,
+        "enable_prof": False,
+        "enable_stats": True,
+        "lg_page": None,
+        "lg_hugepage": None,
+        "malloc_conf": None,
     }
 
     _autotools = None
@@ -66,6 +76,20 @@ class JemallocConan(ConanFile):
             raise ConanInvalidConfiguration("Only Release and Debug build_types are supported")
         if self.settings.compiler == "Visual Studio" and self.settings.arch not in ("x86_64", "x86"):
             raise ConanInvalidConfiguration("Unsupported arch")
+        if self.settings.compiler == "Visual Studio" and self.options.enable_prof:
+            raise ConanInvalidConfiguration("Heap profiling is not supported by the Visual Studio build of jemalloc")
+        for option in ("lg_page", "lg_hugepage"):
+            value = self.options.get_safe(option)
+            if value and not str(value).isdigit():
+                raise ConanInvalidConfiguration("jemalloc:{} must be a base 2 logarithm, e.g. 16 for 64 KiB pages".format(option))
+
+    @property
+    def _prof_libunwind(self):
+        return self.options.enable_prof and self.settings.os in ("Linux", "FreeBSD")
+
+    def requirements(self):
+        if self._prof_libunwind:
+            self.requires("libunwind/1.3.1")
 
     def source(self):
         tools.get(**self.conan_data["sources"][self.version])
@@ -82,14 +106,24 @@ class JemallocConan(ConanFile):
             "--enable-debug" if self.settings.build_type == "Debug" else "--disable-debug",
             "--enable-cxx" if self.options.enable_cxx else "--disable-cxx",
             "--enable-fill" if self.options.enable_fill else "--disable-fill",
-            "--enable-xmalloc" if self.options.enable_cxx else "--disable-xmalloc",
+            "--enable-xmalloc" if self.options.enable_xmalloc else "--disable-xmalloc",
             "--enable-readlinkat" if self.options.enable_readlinkat else "--disable-readlinkat",
             "--enable-syscall" if self.options.enable_syscall else "--disable-syscall",
             "--enable-lazy-lock" if self.options.enable_lazy_lock else "--disable-lazy-lock",
             "--enable-log" if self.options.enable_debug_logging else "--disable-log",
-            "--enable-initial-exec-tld" if self.options.enable_initial_exec_tls else "--disable-initial-exec-tls",
+            "--enable-initial-exec-tls" if self.options.enable_initial_exec_tls else "--disable-initial-exec-tls",
             "--enable-libdl" if self.options.enable_libdl else "--disable-libdl",
+            "--enable-prof" if self.options.enable_prof else "--disable-prof",
+            "--enable-stats" if self.options.enable_stats else "--disable-stats",
         ]
+        if self.options.enable_prof:
+            conf_args.append("--enable-prof-libunwind" if self._prof_libunwind else "--disable-prof-libunwind")
+        if self.options.lg_page:
+            conf_args.append("--with-lg-page={}".format(self.options.lg_page))
+        if self.options.lg_hugepage:
+            conf_args.append("--with-lg-hugepage={}".format(self.options.lg_hugepage))
+        if self.options.malloc_conf:
+            conf_args.append("--with-malloc-conf={}".format(self.options.malloc_conf))
         if self.options.shared:
             conf_args.extend(["--enable-shared", "--disable-static"])
         else:
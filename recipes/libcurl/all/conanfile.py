@@ -30,7 +30,8 @@ class LibcurlConan(ConanFile):
                "with_largemaxwritesize": [True, False],
                "with_nghttp2": [True, False],
                "with_brotli": [True, False],
-               "with_wolfssl": [True, False]
+               "with_wolfssl": [True, False],
+               "resolver": ["threaded", "c-ares", "sync"]
                }
     default_options = {"shared": False,
                        "fPIC": True,
@@ -46,7 +47,8 @@ class LibcurlConan(ConanFile):
                        "with_largemaxwritesize": False,
                        "with_nghttp2": False,
                        "with_brotli": False,
-                       "with_wolfssl": False
+                       "with_wolfssl": False,
+                       "resolver": "threaded"
                        }
     _source_subfolder = "source_subfolder"
     _build_subfolder = "build_subfolder"
@@ -131,6 +133,8 @@ class LibcurlConan(ConanFile):
             self.requires("libnghttp2/1.40.0")
         if self._depends_on_wolfssl:
             self.requires("wolfssl/4.4.0")
+        if self.options.resolver == "c-ares":
+            self.requires("c-ares/1.16.1")
         self.requires("zlib/1.2.11")
 
     @property
@@ -216,6 +220,16 @@ class LibcurlConan(ConanFile):
 
         params.append("--with-zlib=%s" % self.deps_cpp_info["zlib"].lib_paths[0].replace("\\", "/"))
 
+        if self.options.resolver == "c-ares":
+            params.append("--enable-ares=%s" % self.deps_cpp_info["c-ares"].rootpath.replace("\\", "/"))
+            params.append("--disable-threaded-resolver")
+        elif self.options.resolver == "threaded":
+            params.append("--disable-ares")
+            params.append("--enable-threaded-resolver")
+        else:
+            params.append("--disable-ares")
+            params.append("--disable-threaded-resolver")
+
         if not self.options.shared:
             params.append("--disable-shared")
             params.append("--enable-static")
@@ -231,7 +245,6 @@ class LibcurlConan(ConanFile):
             if self.settings.os == "Linux" and "arm" in self.settings.arch:
                 params.append("--host=%s" % self._get_linux_arm_host())
             elif self.settings.os == "iOS":
-                params.append("--enable-threaded-resolver")
                 params.append("--disable-verbose")
             elif self.settings.os == "Android":
                 pass # this just works, conan is great!
@@ -437,6 +450,8 @@ class LibcurlConan(ConanFile):
         self._cmake.definitions["CURL_STATICLIB"] = not self.options.shared
         self._cmake.definitions["CMAKE_DEBUG_POSTFIX"] = ""
         self._cmake.definitions["CMAKE_USE_LIBSSH2"] = self.options.with_libssh2
+        self._cmake.definitions["ENABLE_ARES"] = self.options.resolver == "c-ares"
+        self._cmake.definitions["ENABLE_THREADED_RESOLVER"] = self.options.resolver == "threaded"
 
         # all these options are exclusive. set just one of them
         # mac builds do not use cmake so don't even bother about darwin_ssl
@@ -540,3 +555,5 @@ class LibcurlConan(ConanFile):
             self.cpp_info.components["curl"].requires.append("libssh2::libssh2")
         if self.options.with_nghttp2:
             self.cpp_info.components["curl"].requires.append("libnghttp2::libnghttp2")
+        if self.options.resolver == "c-ares":
+            self.cpp_info.components["curl"].requires.append("c-ares::c-ares")
@@ -12,8 +12,9 @@ class LibpngConan(ConanFile):
     exports_sources = ["CMakeLists.txt", "patches/*"]
     generators = "cmake"
     settings = "os", "arch", "compiler", "build_type"
-    options = {"shared": [True, False], "fPIC": [True, False], "api_prefix": "ANY"}
-    default_options = {'shared': False, 'fPIC': True, "api_prefix": None}
+    options = {"shared": [True, False], "fPIC": [True, False], "api_prefix": "ANY",
+               "hardware_optimizations": [True, False]}
+    default_options = {'shared': False, 'fPIC': True, "api_prefix": None, "hardware_optimizations": True}
     topics = ("conan", "png", "libpng")
 
     _source_subfolder = "source_subfolder"
@@ -33,8 +34,35 @@ class LibpngConan(ConanFile):
         tools.get(**self.conan_data["sources"][self.version])
         os.rename("libpng-" + self.version, self._source_subfolder)
 
+    @property
+    def _is_intel(self):
+        return self.settings.arch in ["x86", "x86_64"]
+
+    @property
+    def _is_arm(self):
+        return str(self.settings.arch).startswith("arm")
+
+    @property
+    def _is_ppc(self):
+        return str(self.settings.arch).startswith("ppc")
+
+    @property
+    def _neon_mode(self):
+        if self.settings.compiler == "Visual Studio":
+            return "off"
+        if str(self.settings.arch).startswith("armv8"):
+            return "on"  # NEON is part of the armv8 baseline
+        if self.settings.os == "Linux":
+            return "check"  # runtime detection reads /proc/cpuinfo
+        return "off"
+
     def _patch(self):
         tools.patch(base_path=self._source_subfolder, patch_file=os.path.join("patches", "CMakeLists-zlib.patch"))
+        if self.options.hardware_optimizations and self._is_intel:
+            # CMAKE_SYSTEM_PROCESSOR is AMD64 with Visual Studio
+            tools.replace_in_file(os.path.join(self._source_subfolder, "CMakeLists.txt"),
+                                  'CMAKE_SYSTEM_PROCESSOR MATCHES "^x86_64*"',
+                                  'CMAKE_SYSTEM_PROCESSOR MATCHES "^(x86_64|AMD64)"')
         tools.replace_in_file(os.path.join(self._source_subfolder, "CMakeLists.txt"),
                               "find_library(M_LIBRARY m)",
                               "set(M_LIBRARY m)")
@@ -67,6 +95,14 @@ class LibpngConan(ConanFile):
             cmake.definitions["ZLIB_INCLUDE_DIR"] = self.deps_cpp_info["zlib"].include_paths[0]
         if self.options.api_prefix:
             cmake.definitions["PNG_PREFIX"] = self.options.api_prefix
+        cmake.definitions["PNG_HARDWARE_OPTIMIZATIONS"] = self.options.hardware_optimizations
+        if self.options.hardware_optimizations:
+            if self._is_intel:
+                cmake.definitions["PNG_INTEL_SSE"] = "on"
+            elif self._is_arm:
+                cmake.definitions["PNG_ARM_NEON"] = self._neon_mode
+            elif self._is_ppc:
+                cmake.definitions["PNG_POWERPC_VSX"] = "on" if self.settings.arch == "ppc64le" else "off"
         cmake.configure()
         return cmake
 
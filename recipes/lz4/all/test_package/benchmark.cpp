@@ -0,0 +1,102 @@
+#include <chrono>
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+#include <vector>
+
+#include "lz4.h"
+#include "lz4hc.h"
+
+namespace {
+
+const size_t corpus_size = 16u << 20;
+const double min_duration = 0.5;
+
+// Log-like text: repetitive structure with varying fields
+std::vector<char> generate_corpus(size_t size)
+{
+    static const char* const levels[] = {"DEBUG", "INFO", "WARN", "ERROR"};
+    static const char* const words[] = {"request", "served", "cache", "miss", "hit", "upstream",
+                                        "timeout", "retry", "connection", "closed", "user", "session"};
+    std::vector<char> corpus;
+    corpus.reserve(size);
+    unsigned seed = 12345;
+    while (corpus.size() < size) {
+        char line[160];
+        seed = seed * 1103515245u + 12345u;
+        int len = std::snprintf(line, sizeof(line), "2020-01-%02u 12:%02u:%02u [%s] %s %s id=%u latency=%ums\n",
+                                1 + (seed >> 8) % 28, (seed >> 12) % 60, (seed >> 16) % 60,
+                                levels[(seed >> 20) % 4], words[(seed >> 4) % 12], words[(seed >> 24) % 12],
+                                seed % 100000, (seed >> 10) % 1000);
+        if (len <= 0) break;
+        size_t n = static_cast<size_t>(len);
+        if (n > size - corpus.size()) n = size - corpus.size();
+        corpus.insert(corpus.end(), line, line + n);
+    }
+    return corpus;
+}
+
+double elapsed(std::chrono::steady_clock::time_point start)
+{
+    return std::chrono::duration<double>(std::chrono::steady_clock::now() - start).count();
+}
+
+template <typename Compress>
+void bench(const char* name, int level, const std::vector<char>& src, Compress compress)
+{
+    const int src_size = static_cast<int>(src.size());
+    std::vector<char> compressed(LZ4_compressBound(src_size));
+    std::vector<char> restored(src.size());
+
+    int compressed_size = 0;
+    unsigned c_runs = 0, d_runs = 0;
+    double c_time, d_time;
+
+    auto start = std::chrono::steady_clock::now();
+    do {
+        compressed_size = compress(src.data(), compressed.data(), src_size, static_cast<int>(compressed.size()), level);
+        if (compressed_size <= 0) {
+            std::fprintf(stderr, "%s compression failed\n", name);
+            std::exit(10);
+        }
+        ++c_runs;
+        c_time = elapsed(start);
+    } while (c_time < min_duration);
+
+    start = std::chrono::steady_clock::now();
+    do {
+        if (LZ4_decompress_safe(compressed.data(), restored.data(), compressed_size, src_size) != src_size) {
+            std::fprintf(stderr, "%s decompression failed\n", name);
+            std::exit(11);
+        }
+        ++d_runs;
+        d_time = elapsed(start);
+    } while (d_time < min_duration);
+
+    if (std::memcmp(src.data(), restored.data(), src.size()) != 0) {
+        std::fprintf(stderr, "%s round trip mismatch at level %d\n", name, level);
+        std::exit(12);
+    }
+
+    std::printf("%s level=%d ratio=%.3f compress_MBps=%.1f decompress_MBps=%.1f\n",
+                name, level, static_cast<double>(src.size()) / compressed_size,
+                static_cast<double>(src.size()) * c_runs / c_time / 1e6,
+                static_cast<double>(src.size()) * d_runs / d_time / 1e6);
+}
+
+} // namespace
+
+int main()
+{
+    const std::vector<char> corpus = generate_corpus(corpus_size);
+    std::printf("lz4 version=%d corpus_bytes=%u\n", LZ4_versionNumber(), static_cast<unsigned>(corpus.size()));
+
+    // For lz4 fast mode the "level" is the acceleration factor
+    for (int acceleration : {1, 8}) {
+        bench("lz4", acceleration, corpus, LZ4_compress_fast);
+    }
+    for (int level : {LZ4HC_CLEVEL_MIN, LZ4HC_CLEVEL_DEFAULT, LZ4HC_CLEVEL_MAX}) {
+        bench("lz4hc", level, corpus, LZ4_compress_HC);
+    }
+    return 0;
+}
@@ -16,3 +16,5 @@ class TestPackageConan(ConanFile):
         if not tools.cross_building(self.settings):
             bin_path = os.path.join("bin", "test_package")
             self.run(bin_path, run_environment=True)
+            if os.environ.get("CONAN_TEST_PACKAGE_BENCHMARK"):
+                self.run(os.path.join("bin", "benchmark"), run_environment=True)
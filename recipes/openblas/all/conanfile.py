@@ -1,4 +1,5 @@
 from conans import ConanFile, CMake, tools
+from conans.errors import ConanInvalidConfiguration
 import os
 
 
@@ -20,13 +21,21 @@ class OpenblasConan(ConanFile):
         "build_lapack": [True, False],
         "use_thread": [True, False],
         "dynamic_arch": [True, False],
+        "use_openmp": [True, False],
+        "target": "ANY",  # e.g. HASWELL, SKYLAKEX, ZEN, ARMV8; detected from the build machine if None
+        "num_threads": "ANY",  # maximum number of threads; detected from the build machine if None
+        "buffersize": "ANY",  # BUFFERSIZE, the GEMM buffer is 32 << buffersize bytes, e.g. 25 for 1 GiB
     }
     default_options = {
         "shared": False,
         "fPIC": True,
         "build_lapack": False,
         "use_thread": True,
-        "dynamic_arch": False
+        "dynamic_arch": False,
+        "use_openmp": False,
+        "target": None,
+        "num_threads": None,
+        "buffersize": None,
     }
     exports_sources = ["CMakeLists.txt"]
     generators = "cmake"
@@ -39,6 +48,24 @@ class OpenblasConan(ConanFile):
         if self.settings.os == "Windows":
             del self.options.fPIC
 
+    def configure(self):
+        if self.options.use_openmp:
+            if not self.options.use_thread:
+                raise ConanInvalidConfiguration("openblas:use_openmp=True requires openblas:use_thread=True")
+            if self.settings.compiler == "Visual Studio":
+                raise ConanInvalidConfiguration("openblas can't be built with OpenMP by Visual Studio")
+        for option in ("num_threads", "buffersize"):
+            value = self.options.get_safe(option)
+            if value and not str(value).isdigit():
+                raise ConanInvalidConfiguration("openblas:{} must be a positive integer".format(option))
+        if self.options.buffersize and tools.Version(self.version) < "0.3.10":
+            # Older versions hardcode BUFFER_SIZE in common_<arch>.h and ignore BUFFERSIZE
+            raise ConanInvalidConfiguration("openblas:buffersize requires openblas 0.3.10 or later")
+
+    def requirements(self):
+        if self.options.use_openmp and self.settings.compiler in ("clang", "apple-clang"):
+            self.requires("llvm-openmp/10.0.0")
+
     def source(self):
         tools.get(**self.conan_data["sources"][self.version])
         os.rename('OpenBLAS-{}'.format(self.version), self._source_subfolder)
@@ -54,6 +81,13 @@ class OpenblasConan(ConanFile):
         self._cmake.definitions["BUILD_WITHOUT_LAPACK"] = not self.options.build_lapack
         self._cmake.definitions["DYNAMIC_ARCH"] = self.options.dynamic_arch
         self._cmake.definitions["USE_THREAD"] = self.options.use_thread
+        self._cmake.definitions["USE_OPENMP"] = self.options.use_openmp
+        if self.options.target:
+            self._cmake.definitions["TARGET"] = str(self.options.target).upper()
+        if self.options.num_threads:
+            self._cmake.definitions["NUM_THREADS"] = self.options.num_threads
+        if self.options.buffersize:
+            self._cmake.definitions["CONAN_OPENBLAS_BUFFERSIZE"] = self.options.buffersize
 
         # Required for safe concurrent calls to OpenBLAS routines
         self._cmake.definitions["USE_LOCKING"] = not self.options.use_thread
@@ -84,6 +118,8 @@ class OpenblasConan(ConanFile):
         if self.settings.os == "Linux":
             if self.options.use_thread:
                 self.cpp_info.system_libs.append("pthread")
+            if self.options.use_openmp and self.settings.compiler == "gcc":
+                self.cpp_info.system_libs.append("gomp")
             if self.options.build_lapack:
                 self.cpp_info.system_libs.append("gfortran")
         self.cpp_info.names["cmake_find_package"] = "OpenBLAS"
@@ -91,9 +91,12 @@ class OpenSSLConan(ConanFile):
                "no_dso": [True, False],
                "capieng_dialog": [True, False],
                "enable_capieng": [True, False],
+               "enable_ec_nistp_64_gcc_128": [True, False],
+               "ia32cap": "ANY",
                "openssldir": "ANY"}
     default_options = {key: False for key in options.keys()}
     default_options["fPIC"] = True
+    default_options["ia32cap"] = None
     default_options["openssldir"] = None
     _env_build = None
     _source_subfolder = "source_subfolder"
@@ -106,12 +109,20 @@ class OpenSSLConan(ConanFile):
               del self.options.no_rc5
               del self.options.no_zlib
 
+        if self.settings.arch not in ("x86", "x86_64"):
+            del self.options.ia32cap
+
         if self.settings.os != "Windows":
             del self.options.capieng_dialog
             del self.options.enable_capieng
         else:
             del self.options.fPIC
 
+    def package_id(self):
+        # OPENSSL_ia32cap is only read at runtime by consumers, it doesn't change the binary
+        if self.settings.arch in ("x86", "x86_64"):
+            del self.info.options.ia32cap
+
     def build_requirements(self):
         if tools.os_info.is_windows:
             if not self._win_bash:
@@ -157,6 +168,16 @@ class OpenSSLConan(ConanFile):
     def configure(self):
         del self.settings.compiler.libcxx
         del self.settings.compiler.cppstd
+        if self.options.enable_ec_nistp_64_gcc_128:
+            # needs a 64-bit little-endian target and a compiler providing __uint128_t
+            if self.settings.arch not in ("x86_64", "armv8", "ppc64le", "mips64"):
+                raise ConanInvalidConfiguration("enable_ec_nistp_64_gcc_128 is not supported on %s" % self.settings.arch)
+            if self.settings.compiler not in ("gcc", "clang", "apple-clang") or self._is_clangcl:
+                raise ConanInvalidConfiguration("enable_ec_nistp_64_gcc_128 requires a compiler with __uint128_t support")
+        ia32cap = self.options.get_safe("ia32cap")
+        if ia32cap and not all(token.strip().startswith(("~", "0x")) or token.strip() == ""
+                               for token in str(ia32cap).split(":")):
+            raise ConanInvalidConfiguration("ia32cap must be an OPENSSL_ia32cap value, e.g. ~0x200000200000000")
 
 
     def requirements(self):
@@ -442,6 +463,8 @@ class OpenSSLConan(ConanFile):
             args.append("-fPIC" if self.options.fPIC else "no-pic")
         if self.settings.os == "Neutrino":
             args.append("-lsocket no-asm")
+        if self.options.enable_ec_nistp_64_gcc_128:
+            args.append("enable-ec_nistp_64_gcc_128")
 
         if self._full_version < "1.1.0":
             if self.options.get_safe("no_zlib"):
@@ -469,7 +492,8 @@ class OpenSSLConan(ConanFile):
 
         for option_name in self.options.values.fields:
             activated = getattr(self.options, option_name)
-            if activated and option_name not in ["fPIC", "openssldir", "capieng_dialog", "enable_capieng"]:
+            if activated and option_name not in ["fPIC", "openssldir", "capieng_dialog", "enable_capieng",
+                                                 "enable_ec_nistp_64_gcc_128", "ia32cap"]:
                 self.output.info("activated option: %s" % option_name)
                 args.append(option_name.replace("_", "-"))
         return args
@@ -606,7 +630,8 @@ class OpenSSLConan(ConanFile):
             if self._use_nmake and self._full_version < "1.1.0":
                 self._run_make(makefile=self._nmake_makefile, targets=["install"], parallel=False)
             else:
-                self._run_make(targets=["install_sw"], parallel=False)
+                # the install targets of the 1.0.x Makefiles are not safe to run in parallel
+                self._run_make(targets=["install_sw"], parallel=self._full_version >= "1.1.0")
 
     @property
     def _cc(self):
@@ -746,3 +771,7 @@ class OpenSSLConan(ConanFile):
         self.cpp_info.components["ssl"].names["cmake_find_package"] = "SSL"
         self.cpp_info.components["ssl"].names["cmake_find_package_multi"] = "SSL"
         self.cpp_info.components["ssl"].names['pkg_config'] = 'libssl'
+
+        if self.options.get_safe("ia32cap"):
+            self.output.info("Setting OPENSSL_ia32cap environment variable: %s" % self.options.ia32cap)
+            self.env_info.OPENSSL_ia32cap = str(self.options.ia32cap)
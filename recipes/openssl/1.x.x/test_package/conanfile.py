@@ -34,4 +34,6 @@ class DefaultNameConan(ConanFile):
         if not tools.cross_building(self.settings):
             bin_path = os.path.join("bin", "digest")
             self.run(bin_path, run_environment=True)
+            if os.environ.get("CONAN_TEST_PACKAGE_BENCHMARK"):
+                self.run(os.path.join("bin", "speed"), run_environment=True)
         assert os.path.exists(os.path.join(self.deps_cpp_info["openssl"].rootpath, "licenses", "LICENSE"))
@@ -0,0 +1,168 @@
+/*
+ * Minimal "openssl speed" equivalent going through the library API.
+ * Prints a single JSON document on stdout, so results can be compared between builds.
+ */
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+
+#include <openssl/bn.h>
+#include <openssl/crypto.h>
+#include <openssl/ec.h>
+#include <openssl/ecdh.h>
+#include <openssl/evp.h>
+#include <openssl/obj_mac.h>
+#include <openssl/opensslv.h>
+#include <openssl/rsa.h>
+#include <openssl/sha.h>
+
+#if OPENSSL_VERSION_NUMBER < 0x10100000L
+#define OpenSSL_version SSLeay_version
+#define OPENSSL_VERSION SSLEAY_VERSION
+#define OPENSSL_CFLAGS SSLEAY_CFLAGS
+#endif
+
+#define MIN_DURATION 1.0
+#define BULK_SIZE 16384
+
+static double now_seconds(void)
+{
+    return (double)clock() / CLOCKS_PER_SEC;
+}
+
+static void die(const char* what)
+{
+    fprintf(stderr, "%s failed\n", what);
+    exit(1);
+}
+
+static void print_json_string(const char* str)
+{
+    putchar('"');
+    for (; *str; ++str) {
+        if (*str == '"' || *str == '\\') {
+            putchar('\\');
+            putchar(*str);
+        } else if ((unsigned char)*str < 0x20) {
+            printf("\\u%04x", (unsigned)(unsigned char)*str);
+        } else {
+            putchar(*str);
+        }
+    }
+    putchar('"');
+}
+
+static void print_result(const char* name, const char* unit, double value, int last)
+{
+    printf("    {\"name\": \"%s\", \"unit\": \"%s\", \"value\": %.2f}%s\n", name, unit, value, last ? "" : ",");
+}
+
+static double bench_aes_256_gcm(void)
+{
+    static unsigned char in[BULK_SIZE], out[BULK_SIZE + 16];
+    unsigned char key[32] = {0}, iv[12] = {0}, tag[16];
+    EVP_CIPHER_CTX* ctx = EVP_CIPHER_CTX_new();
+    unsigned long bytes = 0;
+    double start = now_seconds(), elapsed;
+    int len;
+
+    if (!ctx) die("EVP_CIPHER_CTX_new");
+    do {
+        if (EVP_EncryptInit_ex(ctx, EVP_aes_256_gcm(), NULL, key, iv) != 1) die("EVP_EncryptInit_ex");
+        if (EVP_EncryptUpdate(ctx, out, &len, in, BULK_SIZE) != 1) die("EVP_EncryptUpdate");
+        if (EVP_EncryptFinal_ex(ctx, out + len, &len) != 1) die("EVP_EncryptFinal_ex");
+        if (EVP_CIPHER_CTX_ctrl(ctx, EVP_CTRL_GCM_GET_TAG, sizeof(tag), tag) != 1) die("EVP_CTRL_GCM_GET_TAG");
+        bytes += BULK_SIZE;
+        elapsed = now_seconds() - start;
+    } while (elapsed < MIN_DURATION);
+    EVP_CIPHER_CTX_free(ctx);
+    return bytes / elapsed / 1e6;
+}
+
+static double bench_sha256(void)
+{
+    static unsigned char in[BULK_SIZE];
+    unsigned char md[SHA256_DIGEST_LENGTH];
+    EVP_MD_CTX* ctx = EVP_MD_CTX_create();
+    unsigned long bytes = 0;
+    double start = now_seconds(), elapsed;
+
+    if (!ctx) die("EVP_MD_CTX_create");
+    do {
+        if (EVP_DigestInit_ex(ctx, EVP_sha256(), NULL) != 1) die("EVP_DigestInit_ex");
+        if (EVP_DigestUpdate(ctx, in, BULK_SIZE) != 1) die("EVP_DigestUpdate");
+        if (EVP_DigestFinal_ex(ctx, md, NULL) != 1) die("EVP_DigestFinal_ex");
+        bytes += BULK_SIZE;
+        elapsed = now_seconds() - start;
+    } while (elapsed < MIN_DURATION);
+    EVP_MD_CTX_destroy(ctx);
+    return bytes / elapsed / 1e6;
+}
+
+/* One ECDHE operation: generate an ephemeral key and derive the shared secret with the peer key */
+static double bench_ecdhe_p256(void)
+{
+    EC_KEY* peer = EC_KEY_new_by_curve_name(NID_X9_62_prime256v1);
+    unsigned char secret[32];
+    unsigned long ops = 0;
+    double start, elapsed;
+
+    if (!peer || EC_KEY_generate_key(peer) != 1) die("EC_KEY_generate_key");
+    start = now_seconds();
+    do {
+        EC_KEY* ephemeral = EC_KEY_new_by_curve_name(NID_X9_62_prime256v1);
+        if (!ephemeral || EC_KEY_generate_key(ephemeral) != 1) die("EC_KEY_generate_key");
+        if (ECDH_compute_key(secret, sizeof(secret), EC_KEY_get0_public_key(peer), ephemeral, NULL) <= 0)
+            die("ECDH_compute_key");
+        EC_KEY_free(ephemeral);
+        ++ops;
+        elapsed = now_seconds() - start;
+    } while (elapsed < MIN_DURATION);
+    EC_KEY_free(peer);
+    return ops / elapsed;
+}
+
+static double bench_rsa2048_sign(void)
+{
+    RSA* rsa = RSA_new();
+    BIGNUM* e = BN_new();
+    unsigned char digest[SHA256_DIGEST_LENGTH] = {0};
+    unsigned char* sig;
+    unsigned int sig_len;
+    unsigned long ops = 0;
+    double start, elapsed;
+
+    if (!rsa || !e || BN_set_word(e, RSA_F4) != 1) die("BN_set_word");
+    if (RSA_generate_key_ex(rsa, 2048, e, NULL) != 1) die("RSA_generate_key_ex");
+    sig = (unsigned char*)malloc(RSA_size(rsa));
+    if (!sig) die("malloc");
+    start = now_seconds();
+    do {
+        if (RSA_sign(NID_sha256, digest, sizeof(digest), sig, &sig_len, rsa) != 1) die("RSA_sign");
+        ++ops;
+        elapsed = now_seconds() - start;
+    } while (elapsed < MIN_DURATION);
+    free(sig);
+    BN_free(e);
+    RSA_free(rsa);
+    return ops / elapsed;
+}
+
+int main(void)
+{
+    const char* cflags = OpenSSL_version(OPENSSL_CFLAGS);
+
+    printf("{\n  \"version\": ");
+    print_json_string(OpenSSL_version(OPENSSL_VERSION));
+    printf(",\n  \"cflags\": ");
+    print_json_string(cflags);
+    printf(",\n  \"asm\": %s,\n", strstr(cflags, "OPENSSL_NO_ASM") ? "false" : "true");
+    printf("  \"results\": [\n");
+    print_result("aes-256-gcm", "MB/s", bench_aes_256_gcm(), 0);
+    print_result("sha256", "MB/s", bench_sha256(), 0);
+    print_result("ecdhe-p256", "ops/s", bench_ecdhe_p256(), 0);
+    print_result("rsa2048-sign", "ops/s", bench_rsa2048_sign(), 1);
+    printf("  ]\n}\n");
+    return 0;
+}
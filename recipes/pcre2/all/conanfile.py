@@ -1,4 +1,5 @@
 from conans import ConanFile, CMake, tools
+from conans.errors import ConanInvalidConfiguration
 import os
 
 
@@ -19,7 +20,9 @@ class PCREConan(ConanFile):
         "build_pcre2_8": [True, False],
         "build_pcre2_16": [True, False],
         "build_pcre2_32": [True, False],
-        "support_jit": [True, False]
+        "support_jit": [True, False],
+        "jit_sealloc": [True, False],
+        "build_pcre2grep": [True, False]
     }
     default_options = {
         'shared': False,
@@ -28,7 +31,9 @@ class PCREConan(ConanFile):
         'build_pcre2_8': True,
         'build_pcre2_16': True,
         'build_pcre2_32': True,
-        'support_jit': False
+        'support_jit': True,
+        'jit_sealloc': False,
+        'build_pcre2grep': True
     }
 
     _cmake = None
@@ -46,13 +51,35 @@ class PCREConan(ConanFile):
         extracted_dir = self.name + "-" + self.version
         os.rename(extracted_dir, self._source_subfolder)
 
+    @property
+    def _jit_supported(self):
+        # Architectures with a SLJIT backend in PCRE2 10.32 - 10.35
+        if self.settings.os in ["iOS", "tvOS", "watchOS"]:
+            return False
+        if self.settings.os == "Macos" and self.settings.arch == "armv8":
+            return False
+        return self.settings.arch in ["x86", "x86_64", "armv5el", "armv5hf", "armv6", "armv7", "armv7hf",
+                                      "armv7s", "armv7k", "armv8", "armv8.3", "ppc32be", "ppc32", "ppc64le",
+                                      "ppc64", "mips", "mips64", "sparc"]
+
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        if self.settings.os not in ["Linux", "FreeBSD"]:
+            del self.options.jit_sealloc
+        if not self._jit_supported:
+            self.options.support_jit = False
 
     def configure(self):
         del self.settings.compiler.libcxx
         del self.settings.compiler.cppstd
+        if self.options.support_jit and not self._jit_supported:
+            raise ConanInvalidConfiguration("PCRE2 JIT is not supported on {} {}".format(self.settings.os, self.settings.arch))
+        if self.options.get_safe("jit_sealloc") and not self.options.support_jit:
+            raise ConanInvalidConfiguration("jit_sealloc requires support_jit=True")
+        if not self.options.build_pcre2_8:
+            # pcre2grep only works with the 8-bit library
+            del self.options.build_pcre2grep
 
     def requirements(self):
         self.requires("zlib/1.2.11")
@@ -73,6 +100,9 @@ class PCREConan(ConanFile):
         self._cmake.definitions["PCRE2_BUILD_PCRE2_16"] = self.options.build_pcre2_16
         self._cmake.definitions["PCRE2_BUILD_PCRE2_32"] = self.options.build_pcre2_32
         self._cmake.definitions["PCRE2_SUPPORT_JIT"] = self.options.support_jit
+        self._cmake.definitions["PCRE2_SUPPORT_JIT_SEALLOC"] = self.options.get_safe("jit_sealloc", False)
+        self._cmake.definitions["PCRE2_BUILD_PCRE2GREP"] = self.options.get_safe("build_pcre2grep", False)
+        self._cmake.definitions["PCRE2GREP_SUPPORT_JIT"] = self.options.support_jit
         self._cmake.configure(build_folder=self._build_subfolder)
         return self._cmake
 
@@ -113,3 +143,8 @@ class PCREConan(ConanFile):
             self.cpp_info.libs.append(library_name("pcre2-32"))
         if not self.options.shared:
             self.cpp_info.defines.append("PCRE2_STATIC")
+
+        if self.options.get_safe("build_pcre2grep"):
+            bin_path = os.path.join(self.package_folder, "bin")
+            self.output.info("Appending PATH environment variable: {}".format(bin_path))
+            self.env_info.PATH.append(bin_path)
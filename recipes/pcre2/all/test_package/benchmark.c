@@ -0,0 +1,180 @@
+#define PCRE2_CODE_UNIT_WIDTH 8
+
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+
+#include <pcre2.h>
+
+#if defined(_WIN32)
+#include <windows.h>
+static double now_seconds(void)
+{
+    LARGE_INTEGER freq, counter;
+    QueryPerformanceFrequency(&freq);
+    QueryPerformanceCounter(&counter);
+    return (double)counter.QuadPart / (double)freq.QuadPart;
+}
+#else
+#include <time.h>
+static double now_seconds(void)
+{
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return (double)ts.tv_sec + (double)ts.tv_nsec * 1e-9;
+}
+#endif
+
+#define LINE_COUNT 100000
+#define PASSES 5
+
+struct rule {
+    const char* name;
+    const char* pattern;
+    uint32_t options;
+};
+
+/* Typical log routing rules, each applied to every line */
+static const struct rule rules[] = {
+    {"severity", "^\\d{4}-\\d\\d-\\d\\dT\\d\\d:\\d\\d:\\d\\d\\.\\d{3}Z (?:ERROR|WARN) ", 0},
+    {"server_error", "user_id=(\\d+) .*status=5\\d\\d", 0},
+    {"ipv4", "\\b(?:\\d{1,3}\\.){3}\\d{1,3}\\b", 0},
+    {"network_failure", "timeout|connection reset|refused", PCRE2_CASELESS},
+    {"slow_request", "latency_ms=(?:[5-9]\\d\\d|\\d{4,})\\b", 0},
+};
+
+static const char* levels[] = {"DEBUG", "INFO", "INFO", "INFO", "WARN", "ERROR"};
+static const char* services[] = {"api", "auth", "billing", "search", "gateway"};
+static const char* messages[] = {
+    "request completed",
+    "cache miss for key",
+    "upstream Timeout while waiting for response",
+    "Connection reset by peer",
+    "connection refused by backend",
+    "retrying request",
+};
+
+static unsigned next_random(unsigned* seed)
+{
+    *seed = *seed * 1103515245u + 12345u;
+    return *seed >> 8;
+}
+
+static char* generate_corpus(size_t* size, size_t* line_offsets)
+{
+    size_t const capacity = (size_t)LINE_COUNT * 256;
+    char* corpus = (char*)malloc(capacity);
+    unsigned seed = 12345;
+    size_t pos = 0;
+    int i;
+
+    if (!corpus) {
+        fprintf(stderr, "malloc failed\n");
+        exit(1);
+    }
+    for (i = 0; i < LINE_COUNT; ++i) {
+        unsigned const r = next_random(&seed);
+        line_offsets[i] = pos;
+        pos += (size_t)snprintf(corpus + pos, capacity - pos,
+                                "2020-%02u-%02uT%02u:%02u:%02u.%03uZ %s [%s] client=%u.%u.%u.%u user_id=%u "
+                                "status=%u latency_ms=%u %s\n",
+                                1 + r % 12, 1 + r % 28, r % 24, r % 60, (r >> 6) % 60, r % 1000,
+                                levels[r % 6], services[(r >> 3) % 5],
+                                10 + r % 200, (r >> 4) % 256, (r >> 8) % 256, 1 + (r >> 12) % 254,
+                                next_random(&seed) % 100000,
+                                (r >> 5) % 10 == 0 ? 500 + r % 4 : 200 + (r >> 7) % 5 * 100,
+                                next_random(&seed) % 2000, messages[(r >> 9) % 6]);
+    }
+    line_offsets[LINE_COUNT] = pos;
+    *size = pos;
+    return corpus;
+}
+
+static unsigned long match_corpus(const pcre2_code* code, pcre2_match_data* match_data, uint32_t options,
+                                  const char* corpus, const size_t* line_offsets)
+{
+    unsigned long matches = 0;
+    int i;
+
+    for (i = 0; i < LINE_COUNT; ++i) {
+        PCRE2_SPTR const line = (PCRE2_SPTR)corpus + line_offsets[i];
+        PCRE2_SIZE const length = line_offsets[i + 1] - line_offsets[i] - 1;
+        int const rc = pcre2_match(code, line, length, 0, options, match_data, NULL);
+        if (rc > 0) {
+            ++matches;
+        } else if (rc != PCRE2_ERROR_NOMATCH) {
+            fprintf(stderr, "pcre2_match failed: %d\n", rc);
+            exit(1);
+        }
+    }
+    return matches;
+}
+
+static double bench(const pcre2_code* code, pcre2_match_data* match_data, uint32_t options, const char* corpus,
+                    size_t size, const size_t* line_offsets, unsigned long* matches)
+{
+    double start = now_seconds();
+    int pass;
+
+    for (pass = 0; pass < PASSES; ++pass) {
+        *matches = match_corpus(code, match_data, options, corpus, line_offsets);
+    }
+    return (double)size * PASSES / (now_seconds() - start) / 1e6;
+}
+
+int main(void)
+{
+    static size_t line_offsets[LINE_COUNT + 1];
+    char version[32], jit_target[64] = "none";
+    uint32_t jit = 0;
+    size_t size, i;
+    char* corpus = generate_corpus(&size, line_offsets);
+
+    pcre2_config(PCRE2_CONFIG_VERSION, version);
+    pcre2_config(PCRE2_CONFIG_JIT, &jit);
+    if (jit)
+        pcre2_config(PCRE2_CONFIG_JITTARGET, jit_target);
+    printf("pcre2 version=%s jit=%u jit_target=\"%s\" lines=%d bytes=%lu\n",
+           version, (unsigned)jit, jit_target, LINE_COUNT, (unsigned long)size);
+
+    for (i = 0; i < sizeof(rules) / sizeof(rules[0]); ++i) {
+        pcre2_code* code;
+        pcre2_match_data* match_data;
+        int errorcode;
+        PCRE2_SIZE erroroffset;
+        unsigned long interpreted_matches, jit_matches;
+        double interpreted, jitted;
+
+        code = pcre2_compile((PCRE2_SPTR)rules[i].pattern, PCRE2_ZERO_TERMINATED, rules[i].options,
+                             &errorcode, &erroroffset, NULL);
+        if (!code) {
+            PCRE2_UCHAR message[256];
+            pcre2_get_error_message(errorcode, message, sizeof(message));
+            fprintf(stderr, "pcre2_compile(%s) failed at offset %lu: %s\n",
+                    rules[i].name, (unsigned long)erroroffset, (const char*)message);
+            return 1;
+        }
+        match_data = pcre2_match_data_create_from_pattern(code, NULL);
+
+        interpreted = bench(code, match_data, PCRE2_NO_JIT, corpus, size, line_offsets, &interpreted_matches);
+        printf("pcre2 rule=%s mode=interpreted matches=%lu mb_per_s=%.1f\n",
+               rules[i].name, interpreted_matches, interpreted);
+
+        if (jit && pcre2_jit_compile(code, PCRE2_JIT_COMPLETE) == 0) {
+            jitted = bench(code, match_data, 0, corpus, size, line_offsets, &jit_matches);
+            if (jit_matches != interpreted_matches) {
+                fprintf(stderr, "rule %s: JIT found %lu matches, interpreter %lu\n",
+                        rules[i].name, jit_matches, interpreted_matches);
+                return 2;
+            }
+            printf("pcre2 rule=%s mode=jit matches=%lu mb_per_s=%.1f speedup=%.1f\n",
+                   rules[i].name, jit_matches, jitted, jitted / interpreted);
+        }
+
+        pcre2_match_data_free(match_data);
+        pcre2_code_free(code);
+    }
+
+    free(corpus);
+    return 0;
+}
@@ -6,10 +6,16 @@ class TestPackageConan(ConanFile):
     settings = "os", "compiler", "build_type", "arch"
     generators = "cmake"
 
+    @property
+    def _with_benchmark(self):
+        # The benchmark uses the 8-bit library
+        return self.options['pcre2'].build_pcre2_8
+
     def build(self):
         cmake = CMake(self)
         if self.settings.os == "Windows" and not self.options['pcre2'].shared:
             cmake.definitions['PCRE2_STATIC'] = True
+        cmake.definitions['PCRE2_BENCHMARK'] = self._with_benchmark
         cmake.configure()
         cmake.build()
 
@@ -17,3 +23,5 @@ class TestPackageConan(ConanFile):
         bin_path = os.path.join("bin", "test_package")
         arguments = "%sw+ Bincrafters" % ("\\" if self.settings.os == "Windows" else "\\\\")
         self.run("%s %s" % (bin_path, arguments), run_environment=True)
+        if self._with_benchmark and os.environ.get("CONAN_TEST_PACKAGE_BENCHMARK"):
+            self.run(os.path.join("bin", "benchmark"), run_environment=True)
@@ -16,8 +16,10 @@ class ProtobufConan(ConanFile):
     generators = "cmake"
     short_paths = True
     settings = "os", "arch", "compiler", "build_type"
-    options = {"shared": [True, False], "with_zlib": [True, False], "fPIC": [True, False], "lite": [True, False]}
-    default_options = {"with_zlib": False, "shared": False, "fPIC": True, "lite": False}
+    options = {"shared": [True, False], "with_zlib": [True, False], "fPIC": [True, False], "lite": [True, False],
+               "with_protoc": [True, False], "with_rtti": [True, False]}
+    default_options = {"with_zlib": False, "shared": False, "fPIC": True, "lite": False,
+                       "with_protoc": True, "with_rtti": True}
 
     _cmake = None
 
@@ -45,6 +47,8 @@ class ProtobufConan(ConanFile):
             if compiler_version < "14":
                 raise ConanInvalidConfiguration("On Windows Protobuf can only be built with "
                                                 "Visual Studio 2015 or higher.")
+        if self.options.lite:
+            del self.options.with_protoc
 
     def requirements(self):
         if self.options.with_zlib:
@@ -61,10 +65,11 @@ class ProtobufConan(ConanFile):
         self._cmake.definitions["CMAKE_INSTALL_CMAKEDIR"] = self._cmake_install_base_path.replace("\\", "/")
         self._cmake.definitions["protobuf_BUILD_TESTS"] = False
         self._cmake.definitions["protobuf_WITH_ZLIB"] = self.options.with_zlib
-        self._cmake.definitions["protobuf_BUILD_PROTOC_BINARIES"] = not self.options.lite
+        self._cmake.definitions["protobuf_BUILD_PROTOC_BINARIES"] = self.options.get_safe("with_protoc", False)
         self._cmake.definitions["protobuf_BUILD_PROTOBUF_LITE"] = self.options.lite
         if self.settings.compiler == "Visual Studio":
             self._cmake.definitions["protobuf_MSVC_STATIC_RUNTIME"] = "MT" in self.settings.compiler.runtime
+        self._cmake.definitions["CONAN_PROTOBUF_NO_RTTI"] = not self.options.with_rtti
         self._cmake.configure(build_folder=self._build_subfolder)
         return self._cmake
 
@@ -91,7 +96,9 @@ class ProtobufConan(ConanFile):
 
         if self.settings.os == "Windows":
             if self.options.shared:
-                self.cpp_info.defines = ["PROTOBUF_USE_DLLS"]
+                self.cpp_info.defines.append("PROTOBUF_USE_DLLS")
+        if not self.options.with_rtti:
+            self.cpp_info.defines.append("GOOGLE_PROTOBUF_NO_RTTI")
         self.cpp_info.names["cmake_find_package"] = "Protobuf"
         self.cpp_info.names["cmake_find_package_multi"] = "Protobuf"
         self.cpp_info.builddirs = [
@@ -102,7 +109,8 @@ class ProtobufConan(ConanFile):
             os.path.join(self._cmake_install_base_path, "protobuf-module.cmake"),
             os.path.join(self._cmake_install_base_path, "protobuf-options.cmake"),
         ]
-        bindir = os.path.join(self.package_folder, "bin")
-        self.output.info("Appending PATH environment variable: {}".format(bindir))
-        self.env_info.PATH.append(bindir)
+        if self.options.get_safe("with_protoc"):
+            bindir = os.path.join(self.package_folder, "bin")
+            self.output.info("Appending PATH environment variable: {}".format(bindir))
+            self.env_info.PATH.append(bindir)
 
@@ -9,7 +9,7 @@ class TestPackageConan(ConanFile):
 
     @property
     def _protoc_available(self):
-        return not self.options["protobuf"].lite and not tools.cross_building(self.settings)
+        return self.options["protobuf"].get_safe("with_protoc") and not tools.cross_building(self.settings)
 
     def build(self):
         # Build without protoc
@@ -37,7 +37,8 @@ class TestPackageConan(ConanFile):
 
     def test(self):
         if not tools.cross_building(self.settings):
-            self.run("protoc --version", run_environment=True)
+            if self._protoc_available:
+                self.run("protoc --version", run_environment=True)
 
             # Test the build built without protoc
             bin_path = os.path.join("without_protoc", "bin", "test_package")
@@ -0,0 +1,76 @@
+import os
+from conans import ConanFile, CMake, tools
+from conans.errors import ConanInvalidConfiguration
+from conans.tools import Version
+
+
+class ProtocConan(ConanFile):
+    name = "protoc"
+    description = "Protocol Buffers - Google's data interchange format, compiler only"
+    topics = ("conan", "protobuf", "protocol-buffers",
+              "protocol-compiler", "serialization", "rpc", "protoc")
+    url = "https://github.com/conan-io/conan-center-index"
+    homepage = "https://github.com/protocolbuffers/protobuf"
+    license = "BSD-3-Clause"
+    exports_sources = ["CMakeLists.txt", "patches/*"]
+    generators = "cmake"
+    short_paths = True
+    settings = "os", "arch", "compiler", "build_type"
+
+    _cmake = None
+
+    @property
+    def _source_subfolder(self):
+        return "source_subfolder"
+
+    @property
+    def _build_subfolder(self):
+        return "build_subfolder"
+
+    def source(self):
+        tools.get(**self.conan_data["sources"][self.version])
+        extracted_folder = "protobuf-" + self.version
+        os.rename(extracted_folder, self._source_subfolder)
+
+    def configure(self):
+        if self.settings.os == "Windows" and self.settings.compiler == "Visual Studio":
+            compiler_version = Version(self.settings.compiler.version.value)
+            if compiler_version < "14":
+                raise ConanInvalidConfiguration("On Windows protoc can only be built with "
+                                                "Visual Studio 2015 or higher.")
+
+    def _configure_cmake(self):
+        if self._cmake:
+            return self._cmake
+        self._cmake = CMake(self)
+        # protoc links libprotobuf and libprotoc statically, so the package only contains the executable
+        self._cmake.definitions["protobuf_BUILD_SHARED_LIBS"] = False
+        self._cmake.definitions["protobuf_BUILD_TESTS"] = False
+        self._cmake.definitions["protobuf_WITH_ZLIB"] = False
+        self._cmake.definitions["protobuf_BUILD_PROTOC_BINARIES"] = True
+        self._cmake.definitions["protobuf_BUILD_PROTOBUF_LITE"] = False
+        if self.settings.compiler == "Visual Studio":
+            self._cmake.definitions["protobuf_MSVC_STATIC_RUNTIME"] = "MT" in self.settings.compiler.runtime
+        self._cmake.configure(build_folder=self._build_subfolder)
+        return self._cmake
+
+    def build(self):
+        for patch in self.conan_data["patches"][self.version]:
+            tools.patch(**patch)
+        cmake = self._configure_cmake()
+        cmake.build()
+
+    def package(self):
+        self.copy("LICENSE", dst="licenses", src=self._source_subfolder)
+        cmake = self._configure_cmake()
+        cmake.install()
+        tools.rmdir(os.path.join(self.package_folder, "include"))
+        tools.rmdir(os.path.join(self.package_folder, "lib"))
+
+    def package_id(self):
+        del self.info.settings.compiler
+
+    def package_info(self):
+        bindir = os.path.join(self.package_folder, "bin")
+        self.output.info("Appending PATH environment variable: {}".format(bindir))
+        self.env_info.PATH.append(bindir)
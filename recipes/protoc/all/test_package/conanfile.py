@@ -0,0 +1,14 @@
+import os
+from conans import ConanFile, tools
+
+
+class TestPackageConan(ConanFile):
+    settings = "os", "arch", "compiler", "build_type"
+
+    def test(self):
+        if not tools.cross_building(self.settings):
+            self.run("protoc --version", run_environment=True)
+            self.run("protoc --proto_path={0} --cpp_out=. {1}".format(
+                self.source_folder, os.path.join(self.source_folder, "addressbook.proto")), run_environment=True)
+            assert os.path.isfile("addressbook.pb.cc")
+            assert os.path.isfile("addressbook.pb.h")
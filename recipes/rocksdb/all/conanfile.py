@@ -1,5 +1,5 @@
 from conans import ConanFile, CMake, tools
-from conans.errors import ConanInvalidConfiguration
+from conans.errors import ConanInvalidConfiguration, ConanException
 import os
 import glob
 import shutil
@@ -25,8 +25,11 @@ class RocksDB(ConanFile):
         "with_zstd": [True, False],
         "with_tbb": [True, False],
         "with_jemalloc": [True, False],
-        "enable_sse": [False, "sse42", "avx2"],
-        "use_rtti": [True, False]
+        "enable_sse": [False, "sse42", "avx", "avx2", "native"],
+        "use_rtti": [True, False],
+        "with_numa": [True, False],
+        "with_folly_distributed_mutex": [True, False],
+        "build_tools": [True, False]
     }
     default_options = {
         "shared": False,
@@ -40,7 +43,10 @@ class RocksDB(ConanFile):
         "with_tbb": False,
         "with_jemalloc": False,
         "enable_sse": False,
-        "use_rtti": False
+        "use_rtti": False,
+        "with_numa": False,
+        "with_folly_distributed_mutex": False,
+        "build_tools": False
     }
     exports_sources = ["CMakeLists.txt", "patches/**"]
     generators = "cmake", "cmake_find_package"
@@ -62,6 +68,12 @@ class RocksDB(ConanFile):
         if self.settings.arch != "x86_64":
             del self.options.with_tbb
 
+        if self.settings.os != "Linux":
+            del self.options.with_numa
+
+        if self.settings.os == "Windows":
+            del self.options.with_folly_distributed_mutex
+
         minimal_cpp_standard = "11"
         if self.settings.compiler.cppstd:
             tools.check_min_cppstd(self, minimal_cpp_standard)
@@ -75,6 +87,12 @@ class RocksDB(ConanFile):
            tools.Version(self.settings.compiler.version) < "15":
             raise ConanInvalidConfiguration("Rocksdb requires Visual Studio 15 or later.")
 
+        if self.settings.arch != "x86_64" and self.options.enable_sse not in ["False", "native"]:
+            raise ConanInvalidConfiguration("enable_sse={} requires x86_64".format(self.options.enable_sse))
+
+        if self.options.build_tools and not self.options.with_gflags:
+            raise ConanInvalidConfiguration("build_tools requires with_gflags")
+
         if self.settings.build_type == "Debug":
             self.options.use_rtti = True  # Rtti are used in asserts for debug mode...
 
@@ -92,10 +110,10 @@ class RocksDB(ConanFile):
 
         self._cmake.definitions["FAIL_ON_WARNINGS"] = False
         self._cmake.definitions["WITH_TESTS"] = False
-        self._cmake.definitions["WITH_TOOLS"] = False
-        self._cmake.definitions["WITH_CORE_TOOLS"] = False
-        self._cmake.definitions["WITH_BENCHMARK_TOOLS"] = False
-        self._cmake.definitions["WITH_FOLLY_DISTRIBUTED_MUTEX"] = False
+        self._cmake.definitions["WITH_TOOLS"] = self.options.build_tools
+        self._cmake.definitions["WITH_CORE_TOOLS"] = self.options.build_tools
+        self._cmake.definitions["WITH_BENCHMARK_TOOLS"] = self.options.build_tools
+        self._cmake.definitions["WITH_FOLLY_DISTRIBUTED_MUTEX"] = self.options.get_safe("with_folly_distributed_mutex", False)
         self._cmake.definitions["WITH_MD_LIBRARY"] = self.settings.compiler == "Visual Studio" and "MD" in self.settings.compiler.runtime
         self._cmake.definitions["ROCKSDB_INSTALL_ON_WINDOWS"] = self.settings.os == "Windows"
         self._cmake.definitions["ROCKSDB_LITE"] = self.options.lite
@@ -111,23 +129,34 @@ class RocksDB(ConanFile):
         self._cmake.definitions["ROCKSDB_DLL" ] = self.settings.os == "Windows" and self.options.shared
 
         self._cmake.definitions["USE_RTTI"] = self.options.use_rtti
-        if self.options.enable_sse == "False":
-          self._cmake.definitions["PORTABLE"] = True
-          self._cmake.definitions["FORCE_SSE42"] = False
-        elif self.options.enable_sse == "sse42":
-          self._cmake.definitions["PORTABLE"] = True
-          self._cmake.definitions["FORCE_SSE42"] = True
-        elif self.options.enable_sse == "avx2":
-          self._cmake.definitions["PORTABLE"] = False
-          self._cmake.definitions["FORCE_SSE42"] = False
-
-        # not available yet in CCI
-
-        self._cmake.definitions["WITH_NUMA"] = False
+        # PORTABLE=False means -march=native, so it is only used when explicitly asked for;
+        # every other level stays portable and adds the exact instruction set flags instead
+        enable_sse = str(self.options.enable_sse)
+        self._cmake.definitions["PORTABLE"] = enable_sse != "native"
+        self._cmake.definitions["FORCE_SSE42"] = enable_sse in ["sse42", "avx", "avx2"]
+        isa_flags = self._isa_flags.get(enable_sse)
+        if isa_flags:
+            self._cmake.definitions["CONAN_ROCKSDB_ISA_FLAGS"] = isa_flags
+
+        self._cmake.definitions["WITH_NUMA"] = self.options.get_safe("with_numa", False)
+        # No liburing recipe is available, keep the build from picking up a system copy
+        self._cmake.definitions["WITH_LIBURING"] = False
 
         self._cmake.configure(build_folder=self._build_subfolder)
         return self._cmake
 
+    @property
+    def _isa_flags(self):
+        if self.settings.compiler == "Visual Studio":
+            return {
+                "avx": "/arch:AVX",
+                "avx2": "/arch:AVX2",
+            }
+        return {
+            "avx": "-mavx",
+            "avx2": "-mavx2 -mbmi -mbmi2 -mlzcnt -mpclmul",
+        }
+
     def _patch_sources(self):
         for patch in self.conan_data.get("patches", {}).get(self.version, []):
             tools.patch(**patch)
@@ -172,6 +201,14 @@ class RocksDB(ConanFile):
         self.copy("LICENSE*", dst="licenses", src=self._source_subfolder)
         cmake = self._configure_cmake()
         cmake.install()
+        if self.options.build_tools:
+            # Tools are not installed by upstream. ldb and sst_dump are built under tools/ and
+            # multi-config generators add a Release/ or Debug/ level, so search the whole build tree
+            for tool in ["db_bench", "ldb", "sst_dump"]:
+                for pattern in ["*{}".format(tool), "*{}.exe".format(tool)]:
+                    self.copy(pattern, dst="bin", src=self._build_subfolder, keep_path=False)
+                if not glob.glob(os.path.join(self.package_folder, "bin", "{}*".format(tool))):
+                    raise ConanException("build_tools=True but {} was not found in the build folder".format(tool))
         if self.options.shared:
             self._remove_static_libraries()
             self._remove_cpp_headers() # Force stable ABI for shared libraries
@@ -188,5 +225,12 @@ class RocksDB(ConanFile):
                 self.cpp_info.defines = ["ROCKSDB_DLL"]
         elif self.settings.os == "Linux":
             self.cpp_info.system_libs = ["pthread", "m"]
+            if self.options.with_numa:
+                self.cpp_info.system_libs.append("numa")
         if self.options.lite:
             self.cpp_info.defines.append("ROCKSDB_LITE")
+
+        if self.options.build_tools:
+            bin_path = os.path.join(self.package_folder, "bin")
+            self.output.info("Appending PATH environment variable: {}".format(bin_path))
+            self.env_info.PATH.append(bin_path)
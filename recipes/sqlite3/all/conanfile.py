@@ -1,5 +1,6 @@
 import os
 from conans import ConanFile, CMake, tools
+from conans.errors import ConanInvalidConfiguration
 
 required_conan_version = ">=1.28.0"
 
@@ -34,6 +35,16 @@ class ConanSqlite3(ConanFile):
                "disable_gethostuuid": [True, False],
                "max_blob_size": "ANY",
                "build_executable": [True, False],
+               "default_memstatus": [True, False],
+               "default_mmap_size": "ANY",
+               "max_mmap_size": "ANY",
+               "default_cache_size": "ANY",
+               "default_wal_synchronous": [None, 0, 1, 2, 3],
+               "like_doesnt_match_blobs": [True, False],
+               "omit_deprecated": [True, False],
+               "omit_shared_cache": [True, False],
+               "use_uri": [True, False],
+               "enable_stat4": [True, False],
                }
     default_options = {"shared": False,
                        "fPIC": True,
@@ -56,6 +67,16 @@ class ConanSqlite3(ConanFile):
                        "disable_gethostuuid": False,
                        "max_blob_size": 1000000000,
                        "build_executable": True,
+                       "default_memstatus": True,
+                       "default_mmap_size": None,
+                       "max_mmap_size": None,
+                       "default_cache_size": None,
+                       "default_wal_synchronous": None,
+                       "like_doesnt_match_blobs": False,
+                       "omit_deprecated": False,
+                       "omit_shared_cache": False,
+                       "use_uri": False,
+                       "enable_stat4": False,
                        }
 
     _cmake = None
@@ -73,6 +94,13 @@ class ConanSqlite3(ConanFile):
             del self.options.fPIC
         del self.settings.compiler.libcxx
         del self.settings.compiler.cppstd
+        for option in ["default_mmap_size", "max_mmap_size", "default_cache_size"]:
+            value = str(self.options.get_safe(option))
+            if value != "None" and not value.lstrip("-").isdigit():
+                raise ConanInvalidConfiguration("{} must be an integer, got '{}'".format(option, value))
+        if self.options.default_mmap_size != "None" and self.options.max_mmap_size != "None" and \
+           int(str(self.options.default_mmap_size)) > int(str(self.options.max_mmap_size)):
+            raise ConanInvalidConfiguration("default_mmap_size can't be greater than max_mmap_size")
 
     def source(self):
         tools.get(**self.conan_data["sources"][self.version])
@@ -110,6 +138,20 @@ class ConanSqlite3(ConanFile):
         self._cmake.definitions["HAVE_USLEEP"] = True
         self._cmake.definitions["DISABLE_GETHOSTUUID"] = self.options.disable_gethostuuid
         self._cmake.definitions["MAX_BLOB_SIZE"] = self.options.max_blob_size
+        self._cmake.definitions["DEFAULT_MEMSTATUS"] = self.options.default_memstatus
+        if self.options.default_mmap_size != "None":
+            self._cmake.definitions["DEFAULT_MMAP_SIZE"] = self.options.default_mmap_size
+        if self.options.max_mmap_size != "None":
+            self._cmake.definitions["MAX_MMAP_SIZE"] = self.options.max_mmap_size
+        if self.options.default_cache_size != "None":
+            self._cmake.definitions["DEFAULT_CACHE_SIZE"] = self.options.default_cache_size
+        if self.options.default_wal_synchronous != "None":
+            self._cmake.definitions["DEFAULT_WAL_SYNCHRONOUS"] = self.options.default_wal_synchronous
+        self._cmake.definitions["LIKE_DOESNT_MATCH_BLOBS"] = self.options.like_doesnt_match_blobs
+        self._cmake.definitions["OMIT_DEPRECATED"] = self.options.omit_deprecated
+        self._cmake.definitions["OMIT_SHARED_CACHE"] = self.options.omit_shared_cache
+        self._cmake.definitions["USE_URI"] = self.options.use_uri
+        self._cmake.definitions["ENABLE_STAT4"] = self.options.enable_stat4
         self._cmake.configure()
         return self._cmake
 
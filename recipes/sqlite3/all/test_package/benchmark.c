@@ -0,0 +1,174 @@
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+
+#include <sqlite3.h>
+
+#if defined(_WIN32)
+#include <windows.h>
+static double now_seconds(void)
+{
+    LARGE_INTEGER freq, counter;
+    QueryPerformanceFrequency(&freq);
+    QueryPerformanceCounter(&counter);
+    return (double)counter.QuadPart / (double)freq.QuadPart;
+}
+#else
+#include <time.h>
+static double now_seconds(void)
+{
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return (double)ts.tv_sec + (double)ts.tv_nsec * 1e-9;
+}
+#endif
+
+#define ROW_COUNT 200000
+#define ROWS_PER_TRANSACTION 10000
+#define LOOKUP_COUNT 200000
+#define SCAN_COUNT 2000
+#define SCAN_WIDTH 100
+
+static void check(sqlite3* db, int rc, const char* what)
+{
+    if (rc != SQLITE_OK && rc != SQLITE_DONE && rc != SQLITE_ROW) {
+        fprintf(stderr, "%s failed: %s\n", what, sqlite3_errmsg(db));
+        exit(1);
+    }
+}
+
+static void exec(sqlite3* db, const char* sql)
+{
+    char* errmsg = NULL;
+    if (sqlite3_exec(db, sql, NULL, NULL, &errmsg) != SQLITE_OK) {
+        fprintf(stderr, "%s failed: %s\n", sql, errmsg);
+        sqlite3_free(errmsg);
+        exit(1);
+    }
+}
+
+static unsigned next_random(unsigned* seed)
+{
+    *seed = *seed * 1103515245u + 12345u;
+    return *seed >> 8;
+}
+
+static void print_result(const char* journal, const char* name, unsigned long ops, double elapsed)
+{
+    printf("sqlite3 journal=%s workload=%s ops=%lu ops_per_s=%.0f\n", journal, name, ops, ops / elapsed);
+}
+
+static void bench_insert(sqlite3* db, const char* journal)
+{
+    sqlite3_stmt* stmt;
+    char payload[64];
+    unsigned seed = 12345;
+    double start = now_seconds();
+    int i;
+
+    check(db, sqlite3_prepare_v2(db, "INSERT INTO kv(k, v) VALUES(?, ?);", -1, &stmt, NULL), "prepare insert");
+    for (i = 0; i < ROW_COUNT; ++i) {
+        if (i % ROWS_PER_TRANSACTION == 0) exec(db, "BEGIN;");
+        snprintf(payload, sizeof(payload), "value-%u-%u", next_random(&seed), (unsigned)i);
+        sqlite3_bind_int(stmt, 1, i);
+        sqlite3_bind_text(stmt, 2, payload, -1, SQLITE_TRANSIENT);
+        check(db, sqlite3_step(stmt), "insert");
+        sqlite3_reset(stmt);
+        if ((i + 1) % ROWS_PER_TRANSACTION == 0) exec(db, "COMMIT;");
+    }
+    if (ROW_COUNT % ROWS_PER_TRANSACTION != 0) exec(db, "COMMIT;");
+    sqlite3_finalize(stmt);
+    print_result(journal, "insert", ROW_COUNT, now_seconds() - start);
+}
+
+static void bench_point_lookup(sqlite3* db, const char* journal)
+{
+    sqlite3_stmt* stmt;
+    unsigned seed = 54321;
+    unsigned long found = 0;
+    double start = now_seconds();
+    int i;
+
+    check(db, sqlite3_prepare_v2(db, "SELECT v FROM kv WHERE k = ?;", -1, &stmt, NULL), "prepare lookup");
+    for (i = 0; i < LOOKUP_COUNT; ++i) {
+        sqlite3_bind_int(stmt, 1, (int)(next_random(&seed) % ROW_COUNT));
+        if (sqlite3_step(stmt) == SQLITE_ROW) ++found;
+        sqlite3_reset(stmt);
+    }
+    sqlite3_finalize(stmt);
+    if (found != LOOKUP_COUNT) {
+        fprintf(stderr, "point lookup found %lu rows, expected %d\n", found, LOOKUP_COUNT);
+        exit(2);
+    }
+    print_result(journal, "point_lookup", LOOKUP_COUNT, now_seconds() - start);
+}
+
+static void bench_range_scan(sqlite3* db, const char* journal)
+{
+    sqlite3_stmt* stmt;
+    unsigned seed = 98765;
+    unsigned long rows = 0;
+    double start = now_seconds();
+    int i;
+
+    check(db, sqlite3_prepare_v2(db, "SELECT k, v FROM kv WHERE k BETWEEN ? AND ?;", -1, &stmt, NULL), "prepare scan");
+    for (i = 0; i < SCAN_COUNT; ++i) {
+        int const first = (int)(next_random(&seed) % (ROW_COUNT - SCAN_WIDTH));
+        sqlite3_bind_int(stmt, 1, first);
+        sqlite3_bind_int(stmt, 2, first + SCAN_WIDTH - 1);
+        while (sqlite3_step(stmt) == SQLITE_ROW) ++rows;
+        sqlite3_reset(stmt);
+    }
+    sqlite3_finalize(stmt);
+    if (rows != (unsigned long)SCAN_COUNT * SCAN_WIDTH) {
+        fprintf(stderr, "range scan returned %lu rows, expected %d\n", rows, SCAN_COUNT * SCAN_WIDTH);
+        exit(3);
+    }
+    print_result(journal, "range_scan", SCAN_COUNT, now_seconds() - start);
+}
+
+static void remove_database(const char* path)
+{
+    char sidecar[512];
+    remove(path);
+    snprintf(sidecar, sizeof(sidecar), "%s-wal", path);
+    remove(sidecar);
+    snprintf(sidecar, sizeof(sidecar), "%s-shm", path);
+    remove(sidecar);
+    snprintf(sidecar, sizeof(sidecar), "%s-journal", path);
+    remove(sidecar);
+}
+
+static void run(const char* path, const char* journal)
+{
+    sqlite3* db = NULL;
+    char pragma[64];
+
+    remove_database(path);
+    if (sqlite3_open(path, &db) != SQLITE_OK) {
+        fprintf(stderr, "Can't open database %s: %s\n", path, sqlite3_errmsg(db));
+        exit(1);
+    }
+    snprintf(pragma, sizeof(pragma), "PRAGMA journal_mode=%s;", journal);
+    exec(db, pragma);
+    exec(db, "PRAGMA synchronous=NORMAL;");
+    exec(db, "CREATE TABLE kv(id INTEGER PRIMARY KEY, k INTEGER NOT NULL, v TEXT NOT NULL);");
+    exec(db, "CREATE INDEX kv_k ON kv(k);");
+
+    bench_insert(db, journal);
+    bench_point_lookup(db, journal);
+    bench_range_scan(db, journal);
+
+    sqlite3_close(db);
+    remove_database(path);
+}
+
+int main(int argc, char** argv)
+{
+    const char* path = argc > 1 ? argv[1] : "benchmark.db";
+
+    printf("sqlite3 version=%s threadsafe=%d\n", sqlite3_libversion(), sqlite3_threadsafe());
+    run(path, "DELETE");
+    run(path, "WAL");
+    return 0;
+}
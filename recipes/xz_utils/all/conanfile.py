@@ -1,5 +1,6 @@
 import os
 from conans import ConanFile, tools, AutoToolsBuildEnvironment, MSBuild
+from conans.errors import ConanInvalidConfiguration
 from conans.tools import Version
 
 
@@ -12,8 +13,32 @@ class XZUtils(ConanFile):
     license = "Public Domain, GNU LGPLv2.1, GNU GPLv2, or GNU GPLv3"
 
     settings = "os", "arch", "compiler", "build_type"
-    options = {"shared": [True, False], "fPIC": [True, False]}
-    default_options = {"shared": False, "fPIC": True}
+    options = {
+        "shared": [True, False],
+        "fPIC": [True, False],
+        "threads": ["yes", "no", "posix", "win95", "vista"],
+        "assembler": [True, False],
+        "small": [True, False],
+        "encoders": "ANY",
+        "decoders": "ANY",
+        "match_finders": "ANY",
+        "checks": "ANY",
+    }
+    default_options = {
+        "shared": False,
+        "fPIC": True,
+        "threads": "yes",
+        "assembler": True,
+        "small": False,
+        "encoders": None,
+        "decoders": None,
+        "match_finders": None,
+        "checks": None,
+    }
+
+    _filters = ["lzma1", "lzma2", "delta", "x86", "powerpc", "ia64", "arm", "armthumb", "sparc"]
+    _match_finders = ["hc3", "hc4", "bt2", "bt3", "bt4"]
+    _checks = ["crc32", "crc64", "sha256"]
 
     @property
     def _source_subfolder(self):
@@ -35,10 +60,37 @@ class XZUtils(ConanFile):
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        if self.settings.arch not in ["x86", "x86_64"]:
+            del self.options.assembler
+        if self.settings.compiler == "Visual Studio":
+            # The MSVC build uses the fixed configuration of windows/config.h
+            del self.options.threads
+            if "assembler" in self.options:
+                del self.options.assembler
+            del self.options.small
+            del self.options.encoders
+            del self.options.decoders
+            del self.options.match_finders
+            del self.options.checks
 
     def configure(self):
         del self.settings.compiler.cppstd
         del self.settings.compiler.libcxx
+        threads = self.options.get_safe("threads")
+        if threads in ["win95", "vista"] and self.settings.os != "Windows":
+            raise ConanInvalidConfiguration("threads={} is only available on Windows".format(threads))
+        for option, allowed in [("encoders", self._filters), ("decoders", self._filters),
+                                ("match_finders", self._match_finders), ("checks", self._checks)]:
+            for value in self._option_list(option):
+                if value not in allowed:
+                    raise ConanInvalidConfiguration("Unknown value '{}' in {} option, valid values are: {}".format(
+                                                    value, option, ", ".join(allowed)))
+
+    def _option_list(self, option):
+        value = self.options.get_safe(option)
+        if not value:
+            return []
+        return [item.strip() for item in str(value).split(",") if item.strip()]
 
     def _apply_patches(self):
         # Relax Windows SDK restriction
@@ -95,6 +147,15 @@ class XZUtils(ConanFile):
                 args.extend(["--enable-static", "--disable-shared"])
             if self.settings.build_type == "Debug":
                 args.append("--enable-debug")
+            args.append("--enable-threads={}".format(self.options.threads))
+            if "assembler" in self.options:
+                args.append("--enable-assembler" if self.options.assembler else "--disable-assembler")
+            if self.options.small:
+                args.append("--enable-small")
+            for option in ["encoders", "decoders", "match_finders", "checks"]:
+                values = self._option_list(option)
+                if values:
+                    args.append("--enable-{}={}".format(option.replace("_", "-"), ",".join(values)))
             env_build.configure(args=args, build=False)
             env_build.make()
             env_build.install()
@@ -132,7 +193,7 @@ class XZUtils(ConanFile):
     def package_info(self):
         if not self.options.shared:
             self.cpp_info.defines.append("LZMA_API_STATIC")
-        if self.settings.os == "Linux":
+        if self.settings.os == "Linux" and self.options.get_safe("threads") != "no":
             self.cpp_info.system_libs.append("pthread")
         self.cpp_info.libs = tools.collect_libs(self)
         self.cpp_info.names["pkg_config"] = "liblzma"
@@ -0,0 +1,87 @@
+from conans import ConanFile, CMake, tools
+import os
+
+
+class ZlibNgConan(ConanFile):
+    name = "zlib-ng"
+    license = "Zlib"
+    url = "https://github.com/conan-io/conan-center-index"
+    homepage = "https://github.com/zlib-ng/zlib-ng"
+    description = "zlib data compression library for the next generation systems"
+    topics = ("conan", "zlib-ng", "zlib", "compression")
+    settings = "os", "arch", "compiler", "build_type"
+    options = {
+        "shared": [True, False],
+        "fPIC": [True, False],
+        "zlib_compat": [True, False],
+        "with_gzfileop": [True, False],
+        "with_optim": [True, False],
+        "with_native_instructions": [True, False],
+    }
+    default_options = {
+        "shared": False,
+        "fPIC": True,
+        "zlib_compat": False,
+        "with_gzfileop": True,
+        "with_optim": True,
+        # Keep the binaries portable: SIMD code paths are selected at runtime from the CPU features
+        "with_native_instructions": False,
+    }
+    exports_sources = ["CMakeLists.txt"]
+    generators = "cmake"
+
+    _cmake = None
+
+    @property
+    def _source_subfolder(self):
+        return "source_subfolder"
+
+    @property
+    def _build_subfolder(self):
+        return "build_subfolder"
+
+    def config_options(self):
+        if self.settings.os == "Windows":
+            del self.options.fPIC
+
+    def configure(self):
+        if self.options.shared:
+            del self.options.fPIC
+        if self.options.zlib_compat:
+            # gzFile functions are part of the zlib API, zlib-ng always builds them in compat mode
+            del self.options.with_gzfileop
+        del self.settings.compiler.libcxx
+        del self.settings.compiler.cppstd
+
+    def source(self):
+        tools.get(**self.conan_data["sources"][self.version])
+        os.rename("{}-{}".format(self.name, self.version), self._source_subfolder)
+
+    def _configure_cmake(self):
+        if self._cmake:
+            return self._cmake
+        self._cmake = CMake(self)
+        self._cmake.definitions["ZLIB_COMPAT"] = self.options.zlib_compat
+        self._cmake.definitions["ZLIB_ENABLE_TESTS"] = False
+        self._cmake.definitions["WITH_GZFILEOP"] = self.options.get_safe("with_gzfileop", True)
+        self._cmake.definitions["WITH_OPTIM"] = self.options.with_optim
+        self._cmake.definitions["WITH_NATIVE_INSTRUCTIONS"] = self.options.with_native_instructions
+        self._cmake.configure(build_folder=self._build_subfolder)
+        return self._cmake
+
+    def build(self):
+        cmake = self._configure_cmake()
+        cmake.build()
+
+    def package(self):
+        self.copy("LICENSE.md", src=self._source_subfolder, dst="licenses")
+        cmake = self._configure_cmake()
+        cmake.install()
+        tools.rmdir(os.path.join(self.package_folder, "lib", "cmake"))
+        tools.rmdir(os.path.join(self.package_folder, "lib", "pkgconfig"))
+        tools.rmdir(os.path.join(self.package_folder, "share"))
+
+    def package_info(self):
+        self.cpp_info.libs = tools.collect_libs(self)
+        self.cpp_info.names["cmake_find_package"] = "zlib-ng"
+        self.cpp_info.names["cmake_find_package_multi"] = "zlib-ng"
@@ -0,0 +1,39 @@
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+
+#ifdef ZLIB_COMPAT
+#include <zlib.h>
+#define compressBound_ compressBound
+#define compress_ compress
+#define uncompress_ uncompress
+#define version_ zlibVersion
+typedef uLongf size_type;
+#else
+#include <zlib-ng.h>
+#define compressBound_ zng_compressBound
+#define compress_ zng_compress
+#define uncompress_ zng_uncompress
+#define version_ zlibng_version
+typedef size_t size_type;
+#endif
+
+int main(void)
+{
+    const char text[] = "Conan Package Manager, zlib-ng test package, zlib-ng test package";
+    size_type const size = sizeof(text);
+    size_type compressed_size = compressBound_(size);
+    size_type uncompressed_size = size;
+    unsigned char* compressed = (unsigned char*)malloc(compressed_size);
+    char uncompressed[sizeof(text)];
+
+    printf("zlib-ng version: %s\n", version_());
+    if (compress_(compressed, &compressed_size, (const unsigned char*)text, size) != Z_OK ||
+        uncompress_((unsigned char*)uncompressed, &uncompressed_size, compressed, compressed_size) != Z_OK ||
+        uncompressed_size != size || memcmp(text, uncompressed, size) != 0) {
+        fprintf(stderr, "compression roundtrip failed\n");
+        return EXIT_FAILURE;
+    }
+    free(compressed);
+    return EXIT_SUCCESS;
+}
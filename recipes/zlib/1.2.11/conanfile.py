@@ -1,7 +1,7 @@
 import os
 import stat
 from conans import ConanFile, tools, CMake, AutoToolsBuildEnvironment
-from conans.errors import ConanException
+from conans.errors import ConanException, ConanInvalidConfiguration
 
 
 class ZlibConan(ConanFile):
@@ -13,8 +13,9 @@ class ZlibConan(ConanFile):
     description = ("A Massively Spiffy Yet Delicately Unobtrusive Compression Library "
                    "(Also Free, Not to Mention Unencumbered by Patents)")
     settings = "os", "arch", "compiler", "build_type"
-    options = {"shared": [True, False], "fPIC": [True, False], "minizip": [True, False]}
-    default_options = {"shared": False, "fPIC": True, "minizip": False}
+    options = {"shared": [True, False], "fPIC": [True, False], "minizip": [True, False],
+               "implementation": ["stock", "zlib-ng-compat"]}
+    default_options = {"shared": False, "fPIC": True, "minizip": False, "implementation": "stock"}
     exports_sources = ["CMakeLists.txt", "CMakeLists_minizip.txt", "patches/**"]
     generators = "cmake"
     _source_subfolder = "source_subfolder"
@@ -27,6 +28,16 @@ class ZlibConan(ConanFile):
     def configure(self):
         del self.settings.compiler.libcxx
         del self.settings.compiler.cppstd
+        if self.options.implementation == "zlib-ng-compat" and self.options.minizip:
+            raise ConanInvalidConfiguration("minizip is only available with the stock implementation")
+        if self.options.implementation == "zlib-ng-compat":
+            # Same API and ABI as zlib: libz, zlib.h and zconf.h
+            self.options["zlib-ng"].zlib_compat = True
+            self.options["zlib-ng"].shared = self.options.shared
+
+    def requirements(self):
+        if self.options.implementation == "zlib-ng-compat":
+            self.requires("zlib-ng/2.0.6")
 
     def source(self):
         tools.get(**self.conan_data["sources"][self.version])
@@ -38,6 +49,9 @@ class ZlibConan(ConanFile):
             os.chmod(configure_file, st.st_mode | stat.S_IEXEC)
 
     def build(self):
+        if self.options.implementation == "zlib-ng-compat":
+            # Everything comes from the zlib-ng requirement
+            return
         self._build_zlib()
         if self.options.minizip:
             self._build_minizip()
@@ -142,6 +156,9 @@ class ZlibConan(ConanFile):
                     os.rename(current_lib, os.path.join(lib_path, "zlib.lib"))
 
     def package(self):
+        if self.options.implementation == "zlib-ng-compat":
+            return
+
         # Extract the License/s from the header to a file
         with tools.chdir(os.path.join(self.source_folder, self._source_subfolder)):
             tmp = tools.load("zlib.h")
@@ -170,10 +187,12 @@ class ZlibConan(ConanFile):
         self._rename_libraries()
 
     def package_info(self):
+        self.cpp_info.names["cmake_find_package"] = "ZLIB"
+        self.cpp_info.names["cmake_find_package_multi"] = "ZLIB"
+        if self.options.implementation == "zlib-ng-compat":
+            return
         if self.options.minizip:
             self.cpp_info.libs.append('minizip')
             if self.options.shared:
                 self.cpp_info.defines.append('MINIZIP_DLL')
         self.cpp_info.libs.append('zlib' if self.settings.os == "Windows" else "z")
-        self.cpp_info.names["cmake_find_package"] = "ZLIB"
-        self.cpp_info.names["cmake_find_package_multi"] = "ZLIB"
@@ -1,3 +1,4 @@
+import glob
 import os
 from conans import ConanFile, CMake, tools
 
@@ -12,8 +13,24 @@ class ZstdConan(ConanFile):
     exports_sources = ["CMakeLists.txt", "patches/**"]
     generators = "cmake"
     settings = "os", "arch", "compiler", "build_type"
-    options = {"shared": [True, False], "fPIC": [True, False]}
-    default_options = {"shared": False, "fPIC": True}
+    options = {
+        "shared": [True, False],
+        "fPIC": [True, False],
+        "threading": [True, False],
+        "legacy_support": [0, 1, 2, 3, 4, 5, 6, 7],
+        "build_programs": [True, False],
+        "huf_force_decompress": [None, "x1", "x2"],
+        "force_decompress_sequences": [None, "short", "long"],
+    }
+    default_options = {
+        "shared": False,
+        "fPIC": True,
+        "threading": True,
+        "legacy_support": 0,
+        "build_programs": False,
+        "huf_force_decompress": None,
+        "force_decompress_sequences": None,
+    }
 
     _cmake = None
 
@@ -33,6 +50,8 @@ class ZstdConan(ConanFile):
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+            # Same default as upstream, which only enables multithreading on UNIX
+            self.options.threading = False
 
     def configure(self):
         if self.options.shared:
@@ -44,15 +63,31 @@ class ZstdConan(ConanFile):
         if self._cmake:
             return self._cmake
         self._cmake = CMake(self)
-        self._cmake.definitions["ZSTD_BUILD_PROGRAMS"] = False
-        self._cmake.definitions["ZSTD_BUILD_STATIC"] = not self.options.shared
+        self._cmake.definitions["ZSTD_BUILD_PROGRAMS"] = self.options.build_programs
+        # zstd programs of some versions always link the static library
+        self._cmake.definitions["ZSTD_BUILD_STATIC"] = not self.options.shared or self.options.build_programs
         self._cmake.definitions["ZSTD_BUILD_SHARED"] = self.options.shared
+        self._cmake.definitions["ZSTD_PROGRAMS_LINK_SHARED"] = self.options.shared
+        self._cmake.definitions["ZSTD_MULTITHREAD_SUPPORT"] = self.options.threading
+        self._cmake.definitions["ZSTD_LEGACY_SUPPORT"] = self.options.legacy_support != 0
+        self._cmake.definitions["ZSTD_LEGACY_LEVEL"] = self.options.legacy_support
+        self._cmake.definitions["ZSTD_ZLIB_SUPPORT"] = False
+        self._cmake.definitions["ZSTD_LZMA_SUPPORT"] = False
+        self._cmake.definitions["ZSTD_LZ4_SUPPORT"] = False
+        if self.options.huf_force_decompress:
+            self._cmake.definitions["CONAN_ZSTD_HUF_FORCE_DECOMPRESS"] = str(self.options.huf_force_decompress).upper()
+        if self.options.force_decompress_sequences:
+            self._cmake.definitions["CONAN_ZSTD_FORCE_DECOMPRESS_SEQUENCES"] = str(self.options.force_decompress_sequences).upper()
         self._cmake.configure(build_folder=self._build_subfolder)
         return self._cmake
 
     def _patch_sources(self):
         for patch in self.conan_data.get("patches", {}).get(self.version, []):
             tools.patch(**patch)
+        if tools.Version(self.version) < "1.4.7":
+            # These versions hardcode the legacy level, honor ZSTD_LEGACY_LEVEL instead
+            tools.replace_in_file(os.path.join(self._source_subfolder, "build", "cmake", "CMakeLists.txt"),
+                                  "-DZSTD_LEGACY_SUPPORT=4", "-DZSTD_LEGACY_SUPPORT=${ZSTD_LEGACY_LEVEL}")
 
     def build(self):
         self._patch_sources()
@@ -65,11 +100,21 @@ class ZstdConan(ConanFile):
         cmake.install()
         tools.rmdir(os.path.join(self.package_folder, "lib", "cmake"))
         tools.rmdir(os.path.join(self.package_folder, "lib", "pkgconfig"))
+        tools.rmdir(os.path.join(self.package_folder, "share"))
+        if self.options.shared and self.options.build_programs:
+            for static_lib in glob.glob(os.path.join(self.package_folder, "lib", "*.a")) + \
+                              glob.glob(os.path.join(self.package_folder, "lib", "zstd_static.lib")):
+                os.remove(static_lib)
 
     def package_info(self):
         zstd_cmake = "libzstd_shared" if self.options.shared else "libzstd_static"
         self.cpp_info.components["zstdlib"].names["cmake_find_package"] = zstd_cmake
         self.cpp_info.components["zstdlib"].names["cmake_find_package_multi"] = zstd_cmake
         self.cpp_info.components["zstdlib"].libs = tools.collect_libs(self)
-        if self.settings.os == "Linux":
+        if self.settings.os == "Linux" and self.options.threading:
             self.cpp_info.components["zstdlib"].system_libs.append("pthread")
+
+        if self.options.build_programs:
+            bin_path = os.path.join(self.package_folder, "bin")
+            self.output.info("Appending PATH environment variable: {}".format(bin_path))
+            self.env_info.PATH.append(bin_path)
@@ -0,0 +1,141 @@
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+
+#include <zstd.h>
+
+#if defined(_WIN32)
+#include <windows.h>
+static double now_seconds(void)
+{
+    LARGE_INTEGER freq, counter;
+    QueryPerformanceFrequency(&freq);
+    QueryPerformanceCounter(&counter);
+    return (double)counter.QuadPart / (double)freq.QuadPart;
+}
+#else
+#include <time.h>
+static double now_seconds(void)
+{
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return (double)ts.tv_sec + (double)ts.tv_nsec * 1e-9;
+}
+#endif
+
+#define CORPUS_SIZE (16u << 20)
+#define MIN_DURATION 0.5
+
+static void* malloc_orDie(size_t size)
+{
+    void* const buff = malloc(size);
+    if (buff) return buff;
+    perror("malloc:");
+    exit(1);
+}
+
+/* Log-like text: repetitive structure with varying fields, roughly what compresses in production */
+static void generate_corpus(char* dst, size_t size)
+{
+    static const char* const levels[] = { "DEBUG", "INFO", "WARN", "ERROR" };
+    static const char* const words[] = { "request", "served", "cache", "miss", "hit", "upstream",
+                                         "timeout", "retry", "connection", "closed", "user", "session" };
+    unsigned seed = 12345;
+    size_t pos = 0;
+    while (pos < size) {
+        char line[160];
+        int len;
+        seed = seed * 1103515245u + 12345u;
+        len = snprintf(line, sizeof(line), "2020-01-%02u 12:%02u:%02u [%s] %s %s id=%u latency=%ums\n",
+                       1 + (seed >> 8) % 28, (seed >> 12) % 60, (seed >> 16) % 60,
+                       levels[(seed >> 20) % 4], words[(seed >> 4) % 12], words[(seed >> 24) % 12],
+                       seed % 100000, (seed >> 10) % 1000);
+        if (len <= 0) break;
+        if (pos + (size_t)len > size) len = (int)(size - pos);
+        memcpy(dst + pos, line, (size_t)len);
+        pos += (size_t)len;
+    }
+}
+
+static void bench_level(ZSTD_CCtx* cctx, ZSTD_DCtx* dctx, int level, int workers,
+                        const char* src, size_t srcSize, char* cBuff, size_t cCapacity, char* rBuff)
+{
+    size_t cSize = 0;
+    unsigned cRuns = 0, dRuns = 0;
+    double start, cTime, dTime;
+
+#if ZSTD_VERSION_NUMBER >= 10400
+    ZSTD_CCtx_reset(cctx, ZSTD_reset_session_and_parameters);
+    ZSTD_CCtx_setParameter(cctx, ZSTD_c_compressionLevel, level);
+    ZSTD_CCtx_setParameter(cctx, ZSTD_c_nbWorkers, workers);
+#else
+    (void)workers;
+#endif
+
+    start = now_seconds();
+    do {
+#if ZSTD_VERSION_NUMBER >= 10400
+        cSize = ZSTD_compress2(cctx, cBuff, cCapacity, src, srcSize);
+#else
+        cSize = ZSTD_compressCCtx(cctx, cBuff, cCapacity, src, srcSize, level);
+#endif
+        if (ZSTD_isError(cSize)) {
+            fprintf(stderr, "compression error: %s\n", ZSTD_getErrorName(cSize));
+            exit(10);
+        }
+        ++cRuns;
+        cTime = now_seconds() - start;
+    } while (cTime < MIN_DURATION);
+
+    start = now_seconds();
+    do {
+        size_t const rSize = ZSTD_decompressDCtx(dctx, rBuff, srcSize, cBuff, cSize);
+        if (ZSTD_isError(rSize) || rSize != srcSize) {
+            fprintf(stderr, "decompression error\n");
+            exit(11);
+        }
+        ++dRuns;
+        dTime = now_seconds() - start;
+    } while (dTime < MIN_DURATION);
+
+    if (memcmp(src, rBuff, srcSize) != 0) {
+        fprintf(stderr, "round trip mismatch at level %d\n", level);
+        exit(12);
+    }
+
+    printf("zstd level=%d workers=%d ratio=%.3f compress_MBps=%.1f decompress_MBps=%.1f\n",
+           level, workers, (double)srcSize / (double)cSize,
+           (double)srcSize * cRuns / cTime / 1e6, (double)srcSize * dRuns / dTime / 1e6);
+}
+
+int main(int argc, char** argv)
+{
+    static const int levels[] = { 1, 3, 9, 19 };
+    int const workers = argc > 1 ? atoi(argv[1]) : 0;
+    size_t const srcSize = CORPUS_SIZE;
+    size_t const cCapacity = ZSTD_compressBound(srcSize);
+    char* const src = (char*)malloc_orDie(srcSize);
+    char* const cBuff = (char*)malloc_orDie(cCapacity);
+    char* const rBuff = (char*)malloc_orDie(srcSize);
+    ZSTD_CCtx* const cctx = ZSTD_createCCtx();
+    ZSTD_DCtx* const dctx = ZSTD_createDCtx();
+    size_t i;
+
+    if (cctx == NULL || dctx == NULL) {
+        fprintf(stderr, "cannot create zstd contexts\n");
+        return 2;
+    }
+
+    generate_corpus(src, srcSize);
+    printf("zstd version=%s corpus_bytes=%u\n", ZSTD_versionString(), (unsigned)srcSize);
+    for (i = 0; i < sizeof(levels) / sizeof(levels[0]); ++i) {
+        bench_level(cctx, dctx, levels[i], workers, src, srcSize, cBuff, cCapacity, rBuff);
+    }
+
+    ZSTD_freeCCtx(cctx);
+    ZSTD_freeDCtx(dctx);
+    free(src);
+    free(cBuff);
+    free(rBuff);
+    return 0;
+}
@@ -16,3 +16,6 @@ class TestPackageConan(ConanFile):
         if not tools.cross_building(self.settings):
             bin_path = os.path.join("bin", "test_package")
             self.run(bin_path, run_environment=True)
+            if os.environ.get("CONAN_TEST_PACKAGE_BENCHMARK"):
+                workers = tools.cpu_count() if self.options["zstd"].threading else 0
+                self.run("{} {}".format(os.path.join("bin", "benchmark"), workers), run_environment=True)